@@ -7,24 +7,28 @@
 Both mechanisms resolve to a ``User`` object injected into route handlers
 through FastAPI's dependency-injection system.
 
-A simple in-memory rate limiter is also provided.  For production use,
-replace the in-memory store with Redis (see ``dependencies.py``).
+A sliding-window rate limiter is also provided.  It keeps its hit log in
+Redis (see ``dependencies.py``) when available and falls back to an
+in-memory store otherwise.
 """
 
 from __future__ import annotations
 
+import hashlib
+import hmac
 import time
-from collections import defaultdict
+import uuid
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
 from pydantic import BaseModel
 
 from api.config import Settings, get_settings
+from api.dependencies import get_redis
 
 logger = structlog.get_logger(__name__)
 
@@ -66,9 +70,11 @@ async def _validate_api_key(
     if not api_key:
         return None
 
-    # Constant-time comparison would be ideal; for a portfolio project
-    # a straightforward check is acceptable.
-    if api_key == settings.jwt_secret:
+    # Constant-time comparison so response timing does not leak how much
+    # of the secret a guessed key matched.
+    if hmac.compare_digest(
+        api_key.encode("utf-8"), settings.jwt_secret.encode("utf-8")
+    ):
         return User(subject="api-key-user", scopes=["fleet:read", "fleet:write"], auth_method="api_key")
 
     return None
@@ -78,6 +84,36 @@ async def _validate_api_key(
 # JWT validation
 # ---------------------------------------------------------------------------
 
+# Verified tokens are cached by SHA-256 digest so repeat callers skip the
+# HMAC check and JSON parse.  Entries live at most ``_JWT_CACHE_TTL``
+# seconds and never beyond the token's own ``exp`` claim.
+_JWT_CACHE_TTL = 60.0
+_JWT_CACHE_MAXSIZE = 10_000
+_jwt_cache: dict[bytes, tuple[User, float]] = {}
+
+# Only ``sub`` and ``scopes`` are consumed, so audience / issuer checks are
+# skipped; ``exp`` is still required and enforced.
+_JWT_DECODE_OPTIONS = {
+    "verify_aud": False,
+    "verify_iss": False,
+    "require": ["sub", "exp"],
+}
+
+
+def _cache_jwt_user(key: bytes, user: User, payload: dict[str, Any]) -> None:
+    """Store a verified user, evicting the oldest entry when full."""
+    now = time.time()
+    expires_at = now + _JWT_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+    if expires_at <= now:
+        return
+    if len(_jwt_cache) >= _JWT_CACHE_MAXSIZE:
+        _jwt_cache.pop(next(iter(_jwt_cache)))
+    _jwt_cache[key] = (user, expires_at)
+
+
 async def _validate_jwt(
     credentials: Optional[HTTPAuthorizationCredentials],
     settings: Settings,
@@ -87,18 +123,31 @@ async def _validate_jwt(
         return None
 
     token = credentials.credentials
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _jwt_cache.get(cache_key)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at > time.time():
+            return user
+        del _jwt_cache[cache_key]
+
+    import jwt  # deferred: keeps PyJWT/cryptography out of cold start
+
     try:
         payload = jwt.decode(
             token,
             settings.jwt_secret,
             algorithms=[settings.jwt_algorithm],
+            options=_JWT_DECODE_OPTIONS,
         )
         sub: Optional[str] = payload.get("sub")
         if sub is None:
             return None
         scopes: list[str] = payload.get("scopes", [])
-        return User(subject=sub, scopes=scopes, auth_method="jwt")
-    except JWTError as exc:
+        user = User(subject=sub, scopes=scopes, auth_method="jwt")
+        _cache_jwt_user(cache_key, user, payload)
+        return user
+    except jwt.PyJWTError as exc:
         logger.warning("jwt_decode_failed", error=str(exc))
         return None
 
@@ -113,6 +162,8 @@ def create_access_token(
     settings: Settings | None = None,
 ) -> str:
     """Mint a signed JWT access token."""
+    import jwt
+
     _settings = settings or get_settings()
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=_settings.jwt_expiration_minutes)
@@ -159,12 +210,17 @@ async def get_current_user(
 
 
 # ---------------------------------------------------------------------------
-# Rate limiter (in-memory -- swap for Redis in production)
+# Rate limiter (Redis sorted sets, in-memory fallback)
 # ---------------------------------------------------------------------------
 
 class RateLimiter:
     """Sliding-window rate limiter.
 
+    When the application-level Redis pool is available the hit log for
+    each caller lives in a sorted set (scored by wall-clock time), so the
+    limit holds across every uvicorn worker.  Without Redis -- or if a
+    Redis call fails -- it degrades to a per-process in-memory log.
+
     Parameters
     ----------
     max_requests:
@@ -173,39 +229,119 @@ class RateLimiter:
         Length of the sliding window.
     """
 
+    _SWEEP_EVERY = 1024  # must be a power of two
+
     def __init__(self, max_requests: int = 100, window_seconds: int = 60) -> None:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._hits: dict[str, list[float]] = defaultdict(list)
+        self._hits: dict[str, deque[float]] = defaultdict(deque)
+        # Every ``_SWEEP_EVERY`` local checks, drop callers whose window has
+        # fully expired so the dict tracks active clients, not history.
+        self._calls = 0
 
     def _client_key(self, request: Request) -> str:
         """Derive a rate-limit key from the request.
 
-        Uses the API key if present, otherwise falls back to the
-        client IP address.
+        Uses a SHA-256 digest of the API key if present, so the secret
+        itself never reaches Redis or the logs, otherwise falls back to
+        the client IP address.  The key is memoised on ``request.state`` so
+        stacked limiters on the same request derive it only once.
         """
-        api_key = request.headers.get("x-api-key", "")
+        key: Optional[str] = getattr(request.state, "rate_limit_key", None)
+        if key is not None:
+            return key
+
+        # Single pass over the raw ASGI header list (names are already
+        # lower-cased bytes) instead of building a ``Headers`` wrapper.
+        api_key = forwarded = None
+        for name, value in request.scope["headers"]:
+            if name == b"x-api-key":
+                if api_key is None:
+                    api_key = value
+            elif name == b"x-forwarded-for":
+                if forwarded is None:
+                    forwarded = value
+
         if api_key:
-            return f"apikey:{api_key}"
-        forwarded = request.headers.get("x-forwarded-for")
-        if forwarded:
-            return f"ip:{forwarded.split(',')[0].strip()}"
-        client = request.client
-        host = client.host if client else "unknown"
-        return f"ip:{host}"
-
-    async def __call__(self, request: Request) -> None:
-        """FastAPI dependency -- raises 429 when the limit is exceeded."""
-        key = self._client_key(request)
+            key = f"apikey:{hashlib.sha256(api_key).hexdigest()}"
+        elif forwarded:
+            key = f"ip:{forwarded.split(b',')[0].strip().decode('latin-1')}"
+        else:
+            client = request.client
+            host = client.host if client else "unknown"
+            key = f"ip:{host}"
+
+        request.state.rate_limit_key = key
+        return key
+
+    def _allow_local(self, key: str) -> bool:
+        """Record a hit in the in-process log; return ``False`` if over the limit."""
         now = time.monotonic()
         window_start = now - self.window_seconds
 
-        # Purge expired timestamps
-        hits = self._hits[key]
-        self._hits[key] = [t for t in hits if t > window_start]
+        calls = self._calls = self._calls + 1
+        if calls & (self._SWEEP_EVERY - 1) == 0:
+            self._sweep(window_start)
+
+        # Purge expired timestamps from the head of the (time-ordered) log
         hits = self._hits[key]
+        while hits and hits[0] <= window_start:
+            hits.popleft()
 
         if len(hits) >= self.max_requests:
+            return False
+
+        hits.append(now)
+        return True
+
+    def _sweep(self, window_start: float) -> None:
+        """Remove keys whose newest hit has fallen out of the window."""
+        stale = [k for k, hits in self._hits.items() if not hits or hits[-1] <= window_start]
+        for k in stale:
+            del self._hits[k]
+
+    async def _allow_redis(self, redis: Any, key: str) -> bool:
+        """Record a hit in Redis; return ``False`` if over the limit.
+
+        Only the set cardinality travels back over the wire -- the hit
+        log itself never leaves Redis.  A rejected hit is removed again
+        so callers that keep retrying are not locked out indefinitely.
+        """
+        window = self.window_seconds
+        redis_key = f"ratelimit:{key}"
+        now = time.time()
+        member = f"{now}:{uuid.uuid4().hex}"
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(redis_key, 0, now - window)
+            pipe.zcard(redis_key)
+            pipe.zadd(redis_key, {member: now})
+            pipe.expire(redis_key, window)
+            _, count, _, _ = await pipe.execute()
+
+        if count >= self.max_requests:
+            await redis.zrem(redis_key, member)
+            return False
+        return True
+
+    async def __call__(
+        self,
+        request: Request,
+        redis: Any = Depends(get_redis),
+    ) -> None:
+        """FastAPI dependency -- raises 429 when the limit is exceeded."""
+        key = self._client_key(request)
+
+        allowed: Optional[bool] = None
+        if redis is not None:
+            try:
+                allowed = await self._allow_redis(redis, key)
+            except Exception as exc:
+                logger.warning("rate_limit_redis_failed", error=str(exc))
+        if allowed is None:
+            allowed = self._allow_local(key)
+
+        if not allowed:
             logger.warning(
                 "rate_limit_exceeded",
                 client_key=key,
@@ -217,8 +353,6 @@ async def __call__(self, request: Request) -> None:
                 detail=f"Rate limit exceeded. Maximum {self.max_requests} requests per {self.window_seconds}s.",
             )
 
-        hits.append(now)
-
 
 # Default limiter instance (100 req / 60 s)
 rate_limiter = RateLimiter(max_requests=100, window_seconds=60)
@@ -7,8 +7,7 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -109,7 +108,26 @@ def _validate_log_level(cls, value: str) -> str:
         return upper
 
 
-@lru_cache(maxsize=1)
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
-    """Return a cached singleton of the application settings."""
-    return Settings()
+    """Return the process-wide singleton of the application settings.
+
+    Resolved on every request by several dependencies, so this is a bare
+    global read once the settings have been built on first use.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+def set_settings(settings: Optional[Settings]) -> None:
+    """Replace the settings singleton (tests / overrides).
+
+    Passing ``None`` forces the next ``get_settings`` call to reload
+    from the environment.
+    """
+    global _settings
+    _settings = settings
@@ -1,81 +1,80 @@
 """Shared FastAPI dependencies.
 
 All AWS client factories use aioboto3 for non-blocking I/O so route
-handlers never block the event loop on network calls.  Each dependency
-yields a client scoped to the request lifetime, ensuring sessions are
-properly closed.
+handlers never block the event loop on network calls.  A single
+aioboto3 session and one long-lived client per service are opened in
+the lifespan handler in ``main.py`` and shared across requests, so the
+service models are parsed once and the HTTPS connection pools stay warm.
 
-Redis and database connections are managed as application-level
-singletons initialised during the lifespan handler in ``main.py``.
+Redis and database connections are likewise managed as application-level
+singletons initialised during the lifespan handler.
 """
 
 from __future__ import annotations
 
-from typing import AsyncGenerator
+from typing import TYPE_CHECKING, Any
 
-import aioboto3
 import structlog
-from fastapi import Depends, Request
+from fastapi import Request
 
 from api.config import Settings, get_settings
 
+if TYPE_CHECKING:
+    import aioboto3
+
 logger = structlog.get_logger(__name__)
 
+# Services for which a shared client is opened at startup.  Each client is
+# stored on ``app.state`` under the service name.
+AWS_SERVICES: tuple[str, ...] = ("ec2", "ssm", "cloudwatch")
+
 
 # ---------------------------------------------------------------------------
 # AWS session
 # ---------------------------------------------------------------------------
 
-def _get_aioboto3_session(settings: Settings | None = None) -> aioboto3.Session:
-    """Create an aioboto3 session configured for the target region."""
+def create_aws_session(settings: Settings | None = None) -> aioboto3.Session:
+    """Create an aioboto3 session configured for the target region.
+
+    aioboto3 is imported here rather than at module load so importing
+    the API package does not pay for botocore's service-model loading.
+    """
+    import aioboto3
+
     _settings = settings or get_settings()
     return aioboto3.Session(region_name=_settings.aws_region)
 
 
-async def get_aws_session(
-    settings: Settings = Depends(get_settings),
-) -> aioboto3.Session:
-    """Return an aioboto3 session as a FastAPI dependency."""
-    return _get_aioboto3_session(settings)
+async def get_aws_session(request: Request) -> aioboto3.Session:
+    """Return the application-level aioboto3 session."""
+    return request.app.state.aws_session
 
 
 # ---------------------------------------------------------------------------
 # EC2 async client
 # ---------------------------------------------------------------------------
 
-async def get_ec2_client(
-    settings: Settings = Depends(get_settings),
-) -> AsyncGenerator:
-    """Yield an async EC2 client, closing it after the request."""
-    session = _get_aioboto3_session(settings)
-    async with session.client("ec2") as client:
-        yield client
+async def get_ec2_client(request: Request) -> Any:
+    """Return the shared async EC2 client."""
+    return request.app.state.ec2
 
 
 # ---------------------------------------------------------------------------
 # SSM async client
 # ---------------------------------------------------------------------------
 
-async def get_ssm_client(
-    settings: Settings = Depends(get_settings),
-) -> AsyncGenerator:
-    """Yield an async SSM client, closing it after the request."""
-    session = _get_aioboto3_session(settings)
-    async with session.client("ssm") as client:
-        yield client
+async def get_ssm_client(request: Request) -> Any:
+    """Return the shared async SSM client."""
+    return request.app.state.ssm
 
 
 # ---------------------------------------------------------------------------
 # CloudWatch async client
 # ---------------------------------------------------------------------------
 
-async def get_cloudwatch_client(
-    settings: Settings = Depends(get_settings),
-) -> AsyncGenerator:
-    """Yield an async CloudWatch client, closing it after the request."""
-    session = _get_aioboto3_session(settings)
-    async with session.client("cloudwatch") as client:
-        yield client
+async def get_cloudwatch_client(request: Request) -> Any:
+    """Return the shared async CloudWatch client."""
+    return request.app.state.cloudwatch
 
 
 # ---------------------------------------------------------------------------
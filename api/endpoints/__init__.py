@@ -0,0 +1 @@
+"""Route modules mounted by ``api.main.create_app``."""
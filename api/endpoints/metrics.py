@@ -0,0 +1,141 @@
+"""CloudWatch metric endpoints.
+
+``POST /stream`` answers a ``MetricQuery`` with a ``MetricResponse``-shaped
+JSON body that is written while CloudWatch pages arrive.  Each
+``MetricDataResults`` entry is encoded straight from the boto3 response,
+so large windows never materialise ``MetricSeries`` models in memory.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+
+import orjson
+import structlog
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from api.auth import get_current_user, rate_limiter
+from api.dependencies import get_cloudwatch_client
+from api.models.common import utc_timestamp
+from api.models.metrics import MetricName, MetricQuery
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter()
+
+# Memory and disk are published by the CloudWatch agent; everything else
+# is a native EC2 metric.
+_DEFAULT_NAMESPACES: dict[MetricName, str] = {
+    MetricName.MEMORY_UTILIZATION: "CWAgent",
+    MetricName.DISK_UTILIZATION: "CWAgent",
+}
+
+
+def _build_queries(query: MetricQuery) -> tuple[list[dict[str, Any]], dict[str, str | None]]:
+    """Build GetMetricData queries and the query-ID to instance-ID map.
+
+    An empty ``instance_ids`` list yields a single dimensionless query,
+    i.e. the fleet-wide aggregate.
+    """
+    metric = {
+        "Namespace": query.namespace or _DEFAULT_NAMESPACES.get(query.metric_name, "AWS/EC2"),
+        "MetricName": query.metric_name.value,
+    }
+    targets: list[str | None] = list(query.instance_ids) or [None]
+
+    queries: list[dict[str, Any]] = []
+    instance_by_query_id: dict[str, str | None] = {}
+    for idx, instance_id in enumerate(targets):
+        query_id = f"m{idx}"
+        dimensions = [{"Name": "InstanceId", "Value": instance_id}] if instance_id else []
+        queries.append(
+            {
+                "Id": query_id,
+                "MetricStat": {
+                    "Metric": {**metric, "Dimensions": dimensions},
+                    "Period": query.period_seconds,
+                    "Stat": query.statistic.value,
+                },
+                "ReturnData": True,
+            }
+        )
+        instance_by_query_id[query_id] = instance_id
+    return queries, instance_by_query_id
+
+
+async def _iter_metric_series(
+    cloudwatch: Any, query: MetricQuery
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield one ``MetricSeries``-shaped dict per CloudWatch result page.
+
+    ``unit`` is left out: ``GetMetricData`` does not report it, so the
+    model default applies when the body is parsed.
+    """
+    queries, instance_by_query_id = _build_queries(query)
+    metric_name = query.metric_name.value
+    statistic = query.statistic.value
+
+    kwargs: dict[str, Any] = {
+        "MetricDataQueries": queries,
+        "StartTime": query.start_time,
+        "EndTime": query.end_time,
+        "ScanBy": "TimestampAscending",
+    }
+    while True:
+        response = await cloudwatch.get_metric_data(**kwargs)
+        for result in response.get("MetricDataResults", []):
+            yield {
+                "instance_id": instance_by_query_id.get(result["Id"]),
+                "metric_name": metric_name,
+                "statistic": statistic,
+                "timestamps": result["Timestamps"],
+                "values": result["Values"],
+                "label": result.get("Label", ""),
+            }
+        next_token = response.get("NextToken")
+        if not next_token:
+            return
+        kwargs["NextToken"] = next_token
+
+
+@router.post(
+    "/stream",
+    dependencies=[Depends(get_current_user), Depends(rate_limiter)],
+    summary="Stream metric data for large query windows",
+)
+async def stream_metrics(
+    query: MetricQuery,
+    request: Request,
+    cloudwatch: Any = Depends(get_cloudwatch_client),
+) -> StreamingResponse:
+    """Stream a ``MetricResponse``-shaped body without building models.
+
+    Series are written as they are received, so a long window at fine
+    resolution does not hold every data point in memory at once.  The
+    first page is fetched before the response starts so CloudWatch errors
+    on the query itself still surface as an error status.  A page
+    may return the same query ID more than once; clients should merge
+    series that share an ``instance_id``.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    logger.debug(
+        "metrics_stream_started",
+        metric=query.metric_name.value,
+        instances=len(query.instance_ids),
+    )
+
+    series_iter = _iter_metric_series(cloudwatch, query)
+    first = await anext(series_iter, None)
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b'{"success":true,"data":['
+        if first is not None:
+            yield orjson.dumps(first, option=orjson.OPT_UTC_Z)
+            async for series in series_iter:
+                yield b"," + orjson.dumps(series, option=orjson.OPT_UTC_Z)
+        yield b'],"query":' + orjson.dumps(query.model_dump(mode="json"))
+        yield b',"request_id":' + orjson.dumps(request_id)
+        yield b',"timestamp":' + orjson.dumps(utc_timestamp()) + b"}"
+
+    return StreamingResponse(body(), media_type="application/json")
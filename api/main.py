@@ -5,7 +5,8 @@
 - Request-ID middleware that injects a correlation ID into every
   request/response cycle and binds it to structlog context vars
 - A ``/health`` endpoint for load-balancer probes
-- Lifespan handler that manages Redis connection pool startup / shutdown
+- Lifespan handler that manages the Redis connection pool and shared
+  AWS clients across startup / shutdown
 - All versioned routers mounted under ``/api/v1``
 
 Start locally with::
@@ -15,24 +16,37 @@
 
 from __future__ import annotations
 
-import uuid
-from contextlib import asynccontextmanager
+import secrets
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime, timezone
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+
+import orjson
 
 import structlog
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from api.config import Settings, get_settings
+from api.dependencies import AWS_SERVICES, create_aws_session
+
+_UTC = timezone.utc
 
 # ---------------------------------------------------------------------------
 # Structured logging configuration
 # ---------------------------------------------------------------------------
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """``json.dumps``-compatible serializer backed by orjson."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+
+
 def _configure_logging(settings: Settings) -> None:
     """Set up structlog for JSON output with bound context vars."""
     structlog.configure(
@@ -44,7 +58,7 @@ def _configure_logging(settings: Settings) -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
@@ -56,6 +70,33 @@ def _configure_logging(settings: Settings) -> None:
 logger = structlog.get_logger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Response class
+# ---------------------------------------------------------------------------
+
+
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for types orjson does not encode natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` that encodes with orjson instead of stdlib json.
+
+    Datetimes, UUIDs and enums are encoded natively; naive datetimes are
+    treated as UTC and rendered with a ``Z`` suffix.  Pydantic models
+    returned directly as content are dumped in JSON mode.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+
 # ---------------------------------------------------------------------------
 # Lifespan handler (startup / shutdown)
 # ---------------------------------------------------------------------------
@@ -65,8 +106,8 @@ def _configure_logging(settings: Settings) -> None:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application-level resources.
 
-    * **Startup** -- open Redis connection pool.
-    * **Shutdown** -- close Redis connection pool gracefully.
+    * **Startup** -- open Redis connection pool and shared AWS clients.
+    * **Shutdown** -- close AWS clients and Redis connection pool gracefully.
     """
     settings = get_settings()
     _configure_logging(settings)
@@ -96,9 +137,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.warning("redis_connection_failed", error=str(exc))
         app.state.redis = None
 
+    # --- AWS clients ----------------------------------------------------------
+    aws_clients = AsyncExitStack()
+    session = create_aws_session(settings)
+    app.state.aws_session = session
+    for service in AWS_SERVICES:
+        client = await aws_clients.enter_async_context(session.client(service))
+        setattr(app.state, service, client)
+    logger.info("aws_clients_opened", services=list(AWS_SERVICES))
+
     yield  # ---- application is running ----
 
     # --- Shutdown -------------------------------------------------------------
+    await aws_clients.aclose()
+    logger.info("aws_clients_closed")
+
     if redis_pool is not None:
         await redis_pool.aclose()
         logger.info("redis_disconnected")
@@ -126,6 +179,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -156,37 +210,54 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 # ---------------------------------------------------------------------------
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Inject a correlation ID into every request/response cycle.
 
     The middleware checks for an incoming ``X-Request-ID`` header and
-    reuses it if present; otherwise a new UUID-4 is generated.  The ID
+    reuses it if present; otherwise a random 32-character hex ID is
+    generated.  The ID
     is bound to structlog context vars so every log line emitted during
     the request carries it automatically.
+
+    Implemented as plain ASGI rather than ``BaseHTTPMiddleware`` so the
+    response is not funnelled through an extra task group and memory
+    stream on every request.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        request_id = request.headers.get("x-request-id", str(uuid.uuid4()))
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id") or secrets.token_hex(16)
 
-        # Bind to structlog context for the duration of the request
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(
+        # Bind to structlog context for the duration of the request.  Each
+        # request runs in its own task, so the bindings are reset on exit
+        # rather than clearing the whole context up front.
+        context_tokens = structlog.contextvars.bind_contextvars(
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
+            method=scope["method"],
+            path=scope["path"],
         )
 
         # Store on request state so handlers can read it
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        logger.info("request_started")
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        logger.info("request_completed", status_code=response.status_code)
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                logger.info("request_completed", status_code=message["status"])
+            await send(message)
 
-        return response
+        logger.info("request_started")
+        await self.app(scope, receive, send_with_request_id)
+        # Not in a ``finally``: if the app raises, the bindings must survive
+        # until the outer unhandled-exception handler has logged the error.
+        structlog.contextvars.reset_contextvars(**context_tokens)
 
 
 # ---------------------------------------------------------------------------
@@ -200,10 +271,10 @@ def _register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def _unhandled_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         request_id = getattr(request.state, "request_id", None)
         logger.error("unhandled_exception", error=str(exc), exc_info=exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -212,7 +283,7 @@ async def _unhandled_exception_handler(
                     "message": "An unexpected error occurred.",
                 },
                 "request_id": request_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": datetime.now(_UTC).isoformat(),
             },
         )
 
@@ -231,6 +302,8 @@ def _include_routers(app: FastAPI, settings: Settings) -> None:
     prefix = settings.api_prefix
 
     # Health check is always available (no auth, no versioned prefix)
+    health_cache: dict[str, Any] = {"built_at": 0.0, "body": None}
+
     @app.get(
         "/health",
         tags=["health"],
@@ -238,12 +311,20 @@ def _include_routers(app: FastAPI, settings: Settings) -> None:
         response_model=dict,
     )
     async def health_check() -> dict:
-        """Lightweight liveness probe for load balancers and orchestrators."""
-        return {
-            "status": "healthy",
-            "version": settings.api_version,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
+        """Lightweight liveness probe for load balancers and orchestrators.
+
+        Probes arrive continuously, so the body is rebuilt at most once
+        per second and otherwise served from ``health_cache``.
+        """
+        now = time.time()
+        if now - health_cache["built_at"] >= 1.0:
+            health_cache["body"] = {
+                "status": "healthy",
+                "version": settings.api_version,
+                "timestamp": datetime.fromtimestamp(now, _UTC).isoformat(),
+            }
+            health_cache["built_at"] = now
+        return health_cache["body"]
 
     # Attempt to import and mount endpoint routers.
     # If an endpoints module does not exist yet, log a warning and continue.
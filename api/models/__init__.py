@@ -3,11 +3,18 @@
 from api.models.common import APIResponse, ErrorResponse, PaginationParams
 from api.models.instance import (
     FleetInstance,
+    FleetInstanceListAdapter,
     InstanceHealth,
     InstanceListResponse,
     InstanceState,
 )
-from api.models.command import CommandRequest, CommandResult, CommandStatus
+from api.models.command import (
+    TERMINAL_STATUSES,
+    CommandRequest,
+    CommandRequestListAdapter,
+    CommandResult,
+    CommandStatus,
+)
 from api.models.metrics import MetricDataPoint, MetricQuery, MetricResponse
 
 __all__ = [
@@ -15,12 +22,15 @@
     "ErrorResponse",
     "PaginationParams",
     "FleetInstance",
+    "FleetInstanceListAdapter",
     "InstanceHealth",
     "InstanceListResponse",
     "InstanceState",
     "CommandRequest",
+    "CommandRequestListAdapter",
     "CommandResult",
     "CommandStatus",
+    "TERMINAL_STATUSES",
     "MetricDataPoint",
     "MetricQuery",
     "MetricResponse",
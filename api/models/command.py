@@ -8,11 +8,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware replacement for the deprecated ``datetime.utcnow``."""
+    return datetime.now(_UTC)
 
 
 # ---------------------------------------------------------------------------
@@ -30,6 +37,16 @@ class CommandStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses after which an invocation will not change again.  Use set
+# membership rather than chained comparisons when aggregating results.
+TERMINAL_STATUSES: frozenset[CommandStatus] = frozenset({
+    CommandStatus.SUCCESS,
+    CommandStatus.FAILED,
+    CommandStatus.TIMED_OUT,
+    CommandStatus.CANCELLED,
+})
+
+
 # ---------------------------------------------------------------------------
 # Request
 # ---------------------------------------------------------------------------
@@ -77,6 +94,13 @@ class Config:
         }
 
 
+# Compiled once: validates a whole bulk-dispatch payload in a single
+# pydantic-core call instead of constructing each CommandRequest in turn.
+CommandRequestListAdapter: TypeAdapter[List[CommandRequest]] = TypeAdapter(
+    List[CommandRequest]
+)
+
+
 # ---------------------------------------------------------------------------
 # Result
 # ---------------------------------------------------------------------------
@@ -84,6 +108,8 @@ class Config:
 class InstanceCommandOutput(BaseModel):
     """Per-instance result of a command invocation."""
 
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
     instance_id: str
     status: CommandStatus
     exit_code: Optional[int] = None
@@ -101,7 +127,7 @@ class CommandResult(BaseModel):
         description="Aggregate status across all target instances."
     )
     document_name: str
-    requested_at: datetime = Field(default_factory=datetime.utcnow)
+    requested_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
     instance_results: List[InstanceCommandOutput] = Field(default_factory=list)
     comment: str = ""
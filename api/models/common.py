@@ -6,31 +6,58 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Generic, List, Optional, TypeVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Annotated, Any, Generic, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
 
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with second precision.
+
+    Envelope timestamps are produced pre-formatted so serialising a
+    response does not run a datetime -> string conversion per model.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
 # ---------------------------------------------------------------------------
 # Pagination
 # ---------------------------------------------------------------------------
 
-class PaginationParams(BaseModel):
-    """Query parameters accepted by every list endpoint."""
+@dataclass(slots=True, frozen=True)
+class PaginationParams:
+    """Query parameters accepted by every list endpoint.
 
-    page: int = Field(default=1, ge=1, description="Page number (1-indexed).")
-    page_size: int = Field(
-        default=50, ge=1, le=200, description="Items per page (max 200)."
-    )
+    A slotted dataclass rather than a model: FastAPI still validates the
+    annotated bounds when it is used as ``Depends(PaginationParams)``,
+    and direct construction is checked in ``__post_init__``.
+    """
+
+    page: Annotated[int, Field(ge=1, description="Page number (1-indexed).")] = 1
+    page_size: Annotated[
+        int, Field(ge=1, le=200, description="Items per page (max 200).")
+    ] = 50
+
+    def __post_init__(self) -> None:
+        if self.page < 1:
+            raise ValueError("page must be >= 1")
+        if not 1 <= self.page_size <= 200:
+            raise ValueError("page_size must be between 1 and 200")
 
     @property
     def offset(self) -> int:
         """Calculate the SQL OFFSET for the current page."""
         return (self.page - 1) * self.page_size
 
+    @staticmethod
+    def total_pages(total_items: int, page_size: int) -> int:
+        """Number of pages needed for ``total_items`` (ceiling division)."""
+        return -(-total_items // page_size)
+
 
 class PaginationMeta(BaseModel):
     """Pagination metadata returned alongside list results."""
@@ -40,6 +67,16 @@ class PaginationMeta(BaseModel):
     total_items: int
     total_pages: int
 
+    @classmethod
+    def build(cls, page: int, page_size: int, total_items: int) -> PaginationMeta:
+        """Create metadata, deriving ``total_pages`` with integer ceil-division."""
+        return cls(
+            page=page,
+            page_size=page_size,
+            total_items=total_items,
+            total_pages=PaginationParams.total_pages(total_items, page_size) if page_size else 0,
+        )
+
 
 # ---------------------------------------------------------------------------
 # Unified API response wrappers
@@ -54,7 +91,7 @@ class APIResponse(BaseModel, Generic[T]):
     request_id: Optional[str] = Field(
         default=None, description="Correlation ID echoed from the request."
     )
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: str = Field(default_factory=utc_timestamp)
 
 
 # ---------------------------------------------------------------------------
@@ -78,4 +115,4 @@ class ErrorResponse(BaseModel):
     success: bool = False
     error: ErrorDetail
     request_id: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: str = Field(default_factory=utc_timestamp)
@@ -0,0 +1,31 @@
+"""OpenAPI examples for the API models.
+
+Kept out of the model modules so the example payloads are only imported
+when a JSON schema is actually generated (i.e. when ``/docs`` or
+``/openapi.json`` is first requested).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+FLEET_INSTANCE_EXAMPLE: dict[str, Any] = {
+    "instance_id": "i-0abcdef1234567890",
+    "name": "hyperion-web-001",
+    "state": "running",
+    "health": "healthy",
+    "instance_type": "t3.medium",
+    "private_ip": "10.0.1.42",
+    "availability_zone": "us-east-1a",
+    "ami_id": "ami-0123456789abcdef0",
+    "launch_time": "2026-01-15T08:30:00Z",
+    "ssm_ping_status": "Online",
+    "platform": "Windows",
+    "tags": {
+        "Environment": "production",
+        "ManagedBy": "terraform",
+        "Project": "hyperion-fleet-manager",
+    },
+    "compliance_status": "COMPLIANT",
+    "last_patch_time": "2026-01-20T02:00:00Z",
+}
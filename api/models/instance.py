@@ -7,13 +7,14 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-from api.models.common import PaginationMeta
+from api.models.common import PaginationMeta, utc_timestamp
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +41,13 @@ class InstanceHealth(str, Enum):
     UNKNOWN = "unknown"
 
 
+def _fleet_instance_example(schema: dict[str, Any]) -> None:
+    """Attach the OpenAPI example, importing it only when a schema is built."""
+    from api.models.examples import FLEET_INSTANCE_EXAMPLE
+
+    schema["example"] = FLEET_INSTANCE_EXAMPLE
+
+
 # ---------------------------------------------------------------------------
 # Instance model
 # ---------------------------------------------------------------------------
@@ -47,6 +55,11 @@ class InstanceHealth(str, Enum):
 class FleetInstance(BaseModel):
     """Core representation of a managed Windows fleet instance."""
 
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra=_fleet_instance_example,
+    )
+
     instance_id: str = Field(
         description="EC2 instance ID (e.g. i-0abcdef1234567890)."
     )
@@ -102,29 +115,43 @@ class FleetInstance(BaseModel):
         description="UTC timestamp of the most recent successful patch operation.",
     )
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "instance_id": "i-0abcdef1234567890",
-                "name": "hyperion-web-001",
-                "state": "running",
-                "health": "healthy",
-                "instance_type": "t3.medium",
-                "private_ip": "10.0.1.42",
-                "availability_zone": "us-east-1a",
-                "ami_id": "ami-0123456789abcdef0",
-                "launch_time": "2026-01-15T08:30:00Z",
-                "ssm_ping_status": "Online",
-                "platform": "Windows",
-                "tags": {
-                    "Environment": "production",
-                    "ManagedBy": "terraform",
-                    "Project": "hyperion-fleet-manager",
-                },
-                "compliance_status": "COMPLIANT",
-                "last_patch_time": "2026-01-20T02:00:00Z",
-            }
-        }
+    @classmethod
+    def from_ec2(
+        cls,
+        ec2: dict[str, Any],
+        ssm: Optional[dict[str, Any]] = None,
+    ) -> FleetInstance:
+        """Build an instance from trusted EC2 / SSM API data.
+
+        ``ec2`` is one element of ``Reservations[].Instances`` from
+        ``describe_instances``; ``ssm`` is the matching entry from
+        ``describe_instance_information``, if any.  The SDK has already
+        typed these values, so the state enum is normalised once here and
+        the model is built with ``model_construct`` to skip validation.
+        """
+        # Tag keys repeat across the whole fleet (Name, Environment, ...),
+        # so interning them shares one string object per key.
+        tags = {sys.intern(tag["Key"]): tag["Value"] for tag in ec2.get("Tags", ())}
+        return cls.model_construct(
+            instance_id=ec2["InstanceId"],
+            name=tags.get("Name", ""),
+            state=InstanceState(ec2["State"]["Name"]),
+            instance_type=ec2.get("InstanceType", ""),
+            private_ip=ec2.get("PrivateIpAddress"),
+            availability_zone=ec2.get("Placement", {}).get("AvailabilityZone", ""),
+            ami_id=ec2.get("ImageId", ""),
+            launch_time=ec2.get("LaunchTime"),
+            ssm_ping_status=ssm.get("PingStatus") if ssm else None,
+            platform=ec2.get("PlatformDetails", "Windows"),
+            tags=tags,
+        )
+
+
+# Compiled once for bulk validation / serialisation of instance lists.
+# Building is deferred to first use, matching ``FleetInstance`` itself.
+FleetInstanceListAdapter: TypeAdapter[List[FleetInstance]] = TypeAdapter(
+    List[FleetInstance], config=ConfigDict(defer_build=True)
+)
 
 
 # ---------------------------------------------------------------------------
@@ -138,4 +165,4 @@ class InstanceListResponse(BaseModel):
     data: List[FleetInstance]
     meta: PaginationMeta
     request_id: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: str = Field(default_factory=utc_timestamp)
@@ -8,10 +8,12 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from api.models.common import utc_timestamp
+
 
 # ---------------------------------------------------------------------------
 # Enumerations
@@ -101,7 +103,12 @@ class MetricDataPoint(BaseModel):
 
 
 class MetricSeries(BaseModel):
-    """Metric data for a single instance or the fleet aggregate."""
+    """Metric data for a single instance or the fleet aggregate.
+
+    Points are stored column-wise, exactly as ``GetMetricData`` returns
+    them, so no per-point model is built and the JSON payload carries each
+    key once per series rather than once per point.
+    """
 
     instance_id: Optional[str] = Field(
         default=None,
@@ -109,7 +116,15 @@ class MetricSeries(BaseModel):
     )
     metric_name: str
     statistic: str
-    data_points: List[MetricDataPoint] = Field(default_factory=list)
+    timestamps: List[datetime] = Field(
+        default_factory=list,
+        description="Timestamps of the data points, parallel to ``values``.",
+    )
+    values: List[float] = Field(
+        default_factory=list,
+        description="Data point values, parallel to ``timestamps``.",
+    )
+    unit: str = ""
     label: str = ""
 
 
@@ -118,9 +133,9 @@ class MetricResponse(BaseModel):
 
     success: bool = True
     data: List[MetricSeries]
-    query: Dict[str, object] = Field(
-        default_factory=dict,
+    query: Optional[MetricQuery] = Field(
+        default=None,
         description="Echo of the original query for client convenience.",
     )
     request_id: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: str = Field(default_factory=utc_timestamp)
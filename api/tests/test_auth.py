@@ -0,0 +1,38 @@
+"""Tests for the API authentication and rate-limiting layer."""
+
+from __future__ import annotations
+
+import asyncio
+
+import fakeredis
+from starlette.requests import Request
+
+from api.auth import RateLimiter
+
+
+def _request(api_key: bytes) -> Request:
+    """Build a bare request carrying an ``X-API-Key`` header."""
+    return Request(
+        {
+            "type": "http",
+            "headers": [(b"x-api-key", api_key)],
+            "client": ("203.0.113.7", 50000),
+        }
+    )
+
+
+def test_rate_limiter_does_not_store_raw_api_key_in_redis() -> None:
+    """Test that Redis rate-limit keys carry a digest, not the API key."""
+    api_key = b"hyp_live_secret_key"
+    limiter = RateLimiter(max_requests=5, window_seconds=60)
+
+    async def run() -> list[bytes]:
+        redis = fakeredis.FakeAsyncRedis()
+        await limiter(_request(api_key), redis=redis)
+        return await redis.keys()
+
+    keys = asyncio.run(run())
+
+    assert len(keys) == 1
+    assert keys[0].startswith(b"ratelimit:apikey:")
+    assert api_key not in keys[0]
@@ -0,0 +1,58 @@
+"""Shared boto3 session and client cache for Hyperion Fleet Manager.
+
+All service wrappers obtain their boto3 clients from here so that one
+session, one botocore configuration and one connection pool per service
+are reused across every invocation served by a Lambda execution
+environment.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+# Keep-alive connections pooled for the publish / query / compliance thread
+# pools (50 covers all of them running at once), with adaptive retries to
+# absorb API throttling.  Timeouts are well below botocore's 60 s defaults
+# so a stalled connection is retried instead of consuming the invocation.
+BOTO_CONFIG = BotoConfig(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+_session: boto3.session.Session | None = None
+_clients: dict[tuple[str, str], Any] = {}
+# Session and client creation are not thread-safe in boto3, and clients
+# may first be requested from a worker thread.
+_lock = threading.Lock()
+
+
+def get_client(service_name: str, region: str) -> Any:
+    """Get or create the shared boto3 client for a service and region.
+
+    Args:
+        service_name: AWS service name (e.g. ``"cloudwatch"``).
+        region: AWS region name.
+
+    Returns:
+        Boto3 client for the service.
+    """
+    key = (service_name, region)
+    client = _clients.get(key)
+    if client is None:
+        global _session
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                if _session is None:
+                    _session = boto3.session.Session()
+                client = _clients[key] = _session.client(
+                    service_name, region_name=region, config=BOTO_CONFIG
+                )
+    return client
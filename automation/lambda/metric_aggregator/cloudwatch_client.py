@@ -6,13 +6,15 @@
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
-import boto3
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
 
+from aws_clients import get_client
 from config import Config, MetricNamespace
 from metrics import MetricValue
 
@@ -37,8 +39,18 @@ class CloudWatchMetricClient:
     with proper pagination support.
     """
 
-    # CloudWatch PutMetricData limit
-    MAX_METRICS_PER_BATCH = 20
+    # CloudWatch PutMetricData limits: datums per request and request size
+    MAX_METRICS_PER_BATCH = 1000
+    MAX_PUBLISH_PAYLOAD_BYTES = 1_000_000
+    # Conservative encoded size of one datum, plus each of its dimensions
+    DATUM_ESTIMATED_BYTES = 250
+    DIMENSION_ESTIMATED_BYTES = 120
+    # Concurrent PutMetricData calls when publishing several batches
+    MAX_PUBLISH_WORKERS = 8
+    # CloudWatch GetMetricData limit per request
+    MAX_QUERIES_PER_BATCH = 500
+    # Concurrent GetMetricData batches (API limit is 50 TPS)
+    MAX_QUERY_WORKERS = 4
 
     def __init__(self, config: Config) -> None:
         """Initialize the CloudWatch client.
@@ -48,6 +60,7 @@ def __init__(self, config: Config) -> None:
         """
         self.config = config
         self._client: CloudWatchClient | None = None
+        self._query_templates: dict[tuple[str, str, int, str], dict[str, Any]] = {}
 
     @property
     def client(self) -> CloudWatchClient:
@@ -57,7 +70,7 @@ def client(self) -> CloudWatchClient:
             Boto3 CloudWatch client.
         """
         if self._client is None:
-            self._client = boto3.client("cloudwatch", region_name=self.config.region)
+            self._client = get_client("cloudwatch", self.config.region)
         return self._client
 
     def publish_metrics(
@@ -80,49 +93,47 @@ def publish_metrics(
             return 0
 
         namespace = namespace or self.config.metric_namespace
-        published_count = 0
-
-        # Split into batches of MAX_METRICS_PER_BATCH
-        batches = [
-            metrics[i : i + self.MAX_METRICS_PER_BATCH]
-            for i in range(0, len(metrics), self.MAX_METRICS_PER_BATCH)
-        ]
+        batch_size = self._publish_batch_size(metrics)
+        batch_count = -(-len(metrics) // batch_size)
 
         logger.info(
             "Publishing metrics",
             extra={
                 "total_metrics": len(metrics),
-                "batch_count": len(batches),
+                "batch_count": batch_count,
                 "namespace": namespace,
             },
         )
 
-        for batch_index, batch in enumerate(batches):
-            try:
-                metric_data = [m.to_cloudwatch_format() for m in batch]
-                self.client.put_metric_data(Namespace=namespace, MetricData=metric_data)
-                published_count += len(batch)
-                logger.debug(
-                    "Published metric batch",
-                    extra={
-                        "batch_index": batch_index,
-                        "batch_size": len(batch),
-                    },
-                )
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                error_message = e.response.get("Error", {}).get("Message", str(e))
-                logger.error(
-                    "Failed to publish metric batch",
-                    extra={
-                        "batch_index": batch_index,
-                        "error_code": error_code,
-                        "error_message": error_message,
-                    },
-                )
-                raise CloudWatchClientError(
-                    f"Failed to publish metrics: {error_code} - {error_message}"
-                ) from e
+        # Batches are converted lazily from a single
+        # iterator rather than slicing every batch up front.
+        metrics_iter = iter(metrics)
+        batches = (
+            [m.to_cloudwatch_format() for m in islice(metrics_iter, batch_size)]
+            for _ in range(batch_count)
+        )
+
+        if batch_count == 1:
+            published_count = self._put_batch(namespace, 0, next(batches))
+        else:
+            # PutMetricData calls are pure network wait, so overlap them.
+            # The boto3 client is thread-safe and shared by all workers.
+            # Only ``workers`` batches are converted and in flight at once;
+            # the next one is built as soon as a slot frees up.
+            workers = min(self.MAX_PUBLISH_WORKERS, batch_count)
+            published_count = 0
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                in_flight: set[Future[int]] = set()
+                for batch_index in range(batch_count):
+                    if len(in_flight) >= workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        published_count += sum(future.result() for future in done)
+                    in_flight.add(
+                        executor.submit(
+                            self._put_batch, namespace, batch_index, next(batches)
+                        )
+                    )
+                published_count += sum(future.result() for future in in_flight)
 
         logger.info(
             "Successfully published all metrics",
@@ -130,6 +141,66 @@ def publish_metrics(
         )
         return published_count
 
+    def _publish_batch_size(self, metrics: list[MetricValue]) -> int:
+        """Largest batch that stays within both PutMetricData limits.
+
+        The payload estimate uses the most heavily dimensioned metric, so
+        every batch fits under the request size limit.
+
+        Args:
+            metrics: Metrics about to be published.
+
+        Returns:
+            Number of metrics per PutMetricData call.
+        """
+        max_dimensions = max(len(m.dimensions) for m in metrics)
+        datum_bytes = (
+            self.DATUM_ESTIMATED_BYTES + max_dimensions * self.DIMENSION_ESTIMATED_BYTES
+        )
+        return max(
+            1,
+            min(self.MAX_METRICS_PER_BATCH, self.MAX_PUBLISH_PAYLOAD_BYTES // datum_bytes),
+        )
+
+    def _put_batch(
+        self, namespace: str, batch_index: int, metric_data: list[dict[str, Any]]
+    ) -> int:
+        """Publish a single PutMetricData batch.
+
+        Args:
+            namespace: CloudWatch namespace.
+            batch_index: Position of the batch, for logging.
+            metric_data: Metrics already in CloudWatch format.
+
+        Returns:
+            Number of metrics published.
+
+        Raises:
+            CloudWatchClientError: If publishing fails.
+        """
+        try:
+            self.client.put_metric_data(Namespace=namespace, MetricData=metric_data)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_message = e.response.get("Error", {}).get("Message", str(e))
+            logger.error(
+                "Failed to publish metric batch",
+                extra={
+                    "batch_index": batch_index,
+                    "error_code": error_code,
+                    "error_message": error_message,
+                },
+            )
+            raise CloudWatchClientError(
+                f"Failed to publish metrics: {error_code} - {error_message}"
+            ) from e
+
+        logger.debug(
+            "Published metric batch",
+            extra={"batch_index": batch_index, "batch_size": len(metric_data)},
+        )
+        return len(metric_data)
+
     def get_metric_statistics(
         self,
         namespace: str,
@@ -277,67 +348,171 @@ def query_instance_metrics(
         Returns:
             Dictionary mapping instance ID to metric value.
         """
+        results = self.query_many(
+            instance_ids,
+            [(namespace, metric_name)],
+            start_time=start_time,
+            end_time=end_time,
+            period=period,
+            stat=stat,
+        )
+        return {instance_id: values[0] for instance_id, values in results.items()}
+
+    def query_many(
+        self,
+        instance_ids: list[str],
+        metrics: list[tuple[str, str]],
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        period: int = 300,
+        stat: str = "Average",
+    ) -> dict[str, list[float | None]]:
+        """Query several metrics for multiple instances in one GetMetricData pass.
+
+        Every (metric, instance) pair becomes one query, so fetching three
+        metrics for N instances costs ceil(3N / 500) API calls rather than
+        one set of calls per metric.
+
+        Args:
+            instance_ids: List of EC2 instance IDs.
+            metrics: ``(namespace, metric_name)`` pairs.
+            start_time: Start of time range.
+            end_time: End of time range.
+            period: Period in seconds.
+            stat: Statistic to retrieve.
+
+        Returns:
+            Dictionary mapping instance ID to its values, one per entry of
+            ``metrics`` and in the same order.
+        """
+        metric_count = len(metrics)
+        results: dict[str, list[float | None]] = {
+            instance_id: [None] * metric_count for instance_id in instance_ids
+        }
         if not instance_ids:
-            return {}
+            return results
 
         if end_time is None:
             end_time = datetime.now(timezone.utc)
         if start_time is None:
             start_time = end_time - timedelta(minutes=self.config.aggregation_period_minutes)
 
-        # Build queries for each instance
+        # Build one query per (metric, instance).  Only the Id and the
+        # instance dimension vary, so the constant parts come from a cached
+        # template and are merged into each query.  Results are matched
+        # back by query ID rather than by position, so batches can complete
+        # in any order.
         queries: list[dict[str, Any]] = []
-        for idx, instance_id in enumerate(instance_ids):
-            query_id = f"m{idx}"
-            queries.append({
-                "Id": query_id,
+        target_by_query_id: dict[str, tuple[str, int]] = {}
+        for metric_index, (namespace, metric_name) in enumerate(metrics):
+            template = self._query_template(metric_name, namespace, period, stat)
+            metric_stat = template["MetricStat"]
+            metric = metric_stat["Metric"]
+            for instance_id in instance_ids:
+                query_id = f"m{len(queries)}"
+                queries.append(
+                    {
+                        **template,
+                        "Id": query_id,
+                        "MetricStat": {
+                            **metric_stat,
+                            "Metric": {
+                                **metric,
+                                "Dimensions": [{"Name": "InstanceId", "Value": instance_id}],
+                            },
+                        },
+                    }
+                )
+                target_by_query_id[query_id] = (instance_id, metric_index)
+
+        # Query in batches of 500 (CloudWatch limit).  Each batch paginates
+        # independently, so batches run concurrently on the shared client.
+        batch_size = self.MAX_QUERIES_PER_BATCH
+        batch_starts = range(0, len(queries), batch_size)
+
+        def run_batch(i: int) -> dict[tuple[str, int], float]:
+            return self._query_metric_batch(
+                queries[i : i + batch_size],
+                target_by_query_id,
+                i,
+                start_time,
+                end_time,
+            )
+
+        if len(batch_starts) == 1:
+            batch_results = [run_batch(0)]
+        else:
+            workers = min(self.MAX_QUERY_WORKERS, len(batch_starts))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_results = list(executor.map(run_batch, batch_starts))
+
+        for batch in batch_results:
+            for (instance_id, metric_index), value in batch.items():
+                results[instance_id][metric_index] = value
+
+        return results
+
+    def _query_template(
+        self, metric_name: str, namespace: str, period: int, stat: str
+    ) -> dict[str, Any]:
+        """Return the shared query skeleton for a metric/stat combination.
+
+        Templates are never mutated; callers merge them into new dicts.
+        """
+        key = (metric_name, namespace, period, stat)
+        template = self._query_templates.get(key)
+        if template is None:
+            template = self._query_templates[key] = {
                 "MetricStat": {
-                    "Metric": {
-                        "Namespace": namespace,
-                        "MetricName": metric_name,
-                        "Dimensions": [
-                            {"Name": "InstanceId", "Value": instance_id}
-                        ],
-                    },
+                    "Metric": {"Namespace": namespace, "MetricName": metric_name},
                     "Period": period,
                     "Stat": stat,
                 },
                 "ReturnData": True,
-            })
+            }
+        return template
 
-        # Query in batches of 500 (CloudWatch limit)
-        batch_size = 500
-        results: dict[str, float | None] = {iid: None for iid in instance_ids}
+    def _query_metric_batch(
+        self,
+        batch_queries: list[dict[str, Any]],
+        target_by_query_id: dict[str, tuple[str, int]],
+        batch_start: int,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> dict[tuple[str, int], float]:
+        """Run one GetMetricData batch and map results back to their targets.
 
-        for i in range(0, len(queries), batch_size):
-            batch_queries = queries[i : i + batch_size]
-            batch_instance_ids = instance_ids[i : i + batch_size]
+        A failed batch is logged and yields no values so the remaining
+        batches still contribute.
 
-            try:
-                metric_results = self.get_metric_data(
-                    batch_queries, start_time, end_time
-                )
+        Args:
+            batch_queries: Up to 500 metric data queries.
+            target_by_query_id: Mapping of query ID to
+                ``(instance_id, metric_index)``.
+            batch_start: Offset of the batch within the full query list.
+            start_time: Start of time range.
+            end_time: End of time range.
 
-                for result in metric_results:
-                    # Extract instance ID from query ID
-                    query_id = result.get("Id", "")
-                    if query_id.startswith("m"):
-                        try:
-                            idx = int(query_id[1:])
-                            instance_id = batch_instance_ids[idx - (i)]
-                            values = result.get("Values", [])
-                            if values:
-                                # Use the most recent value
-                                results[instance_id] = values[0]
-                        except (ValueError, IndexError):
-                            continue
-
-            except CloudWatchClientError:
-                logger.warning(
-                    "Failed to query batch metrics",
-                    extra={"batch_start": i, "metric_name": metric_name},
-                )
-                continue
+        Returns:
+            Dictionary mapping ``(instance_id, metric_index)`` to its most
+            recent value.
+        """
+        results: dict[tuple[str, int], float] = {}
+        try:
+            metric_results = self.get_metric_data(batch_queries, start_time, end_time)
+        except CloudWatchClientError:
+            logger.warning(
+                "Failed to query batch metrics",
+                extra={"batch_start": batch_start, "query_count": len(batch_queries)},
+            )
+            return results
+
+        for result in metric_results:
+            target = target_by_query_id.get(result.get("Id", ""))
+            values = result.get("Values")
+            if target is not None and values:
+                # Use the most recent value
+                results[target] = values[0]
 
         return results
 
@@ -7,9 +7,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
 
 
 class Environment(Enum):
@@ -20,56 +23,52 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
-@dataclass(frozen=True)
 class MetricNamespace:
     """CloudWatch metric namespace definitions."""
 
     # Custom namespace for Hyperion Fleet Manager metrics
-    HYPERION_FLEET: ClassVar[str] = "Hyperion/FleetManager"
+    HYPERION_FLEET: Final[str] = "Hyperion/FleetManager"
     # AWS built-in namespaces for querying
-    EC2: ClassVar[str] = "AWS/EC2"
-    CW_AGENT: ClassVar[str] = "CWAgent"
+    EC2: Final[str] = "AWS/EC2"
+    CW_AGENT: Final[str] = "CWAgent"
 
 
-@dataclass(frozen=True)
 class MetricNames:
     """Standardized metric names for the fleet."""
 
     # Utilization metrics
-    CPU_UTILIZATION: ClassVar[str] = "CPUUtilization"
-    MEMORY_UTILIZATION: ClassVar[str] = "MemoryUtilization"
-    DISK_UTILIZATION: ClassVar[str] = "DiskUtilization"
+    CPU_UTILIZATION: Final[str] = "CPUUtilization"
+    MEMORY_UTILIZATION: Final[str] = "MemoryUtilization"
+    DISK_UTILIZATION: Final[str] = "DiskUtilization"
 
     # Fleet metrics
-    INSTANCE_COUNT: ClassVar[str] = "InstanceCount"
-    RUNNING_INSTANCES: ClassVar[str] = "RunningInstances"
-    STOPPED_INSTANCES: ClassVar[str] = "StoppedInstances"
-    PENDING_INSTANCES: ClassVar[str] = "PendingInstances"
+    INSTANCE_COUNT: Final[str] = "InstanceCount"
+    RUNNING_INSTANCES: Final[str] = "RunningInstances"
+    STOPPED_INSTANCES: Final[str] = "StoppedInstances"
+    PENDING_INSTANCES: Final[str] = "PendingInstances"
 
     # Aggregated metrics
-    FLEET_HEALTH_SCORE: ClassVar[str] = "FleetHealthScore"
-    COMPLIANCE_SCORE: ClassVar[str] = "ComplianceScore"
-    COST_EFFICIENCY_SCORE: ClassVar[str] = "CostEfficiencyScore"
-    CAPACITY_UTILIZATION: ClassVar[str] = "CapacityUtilization"
+    FLEET_HEALTH_SCORE: Final[str] = "FleetHealthScore"
+    COMPLIANCE_SCORE: Final[str] = "ComplianceScore"
+    COST_EFFICIENCY_SCORE: Final[str] = "CostEfficiencyScore"
+    CAPACITY_UTILIZATION: Final[str] = "CapacityUtilization"
 
     # Cost metrics
-    COST_PER_INSTANCE: ClassVar[str] = "CostPerInstance"
-    TOTAL_FLEET_COST: ClassVar[str] = "TotalFleetCost"
+    COST_PER_INSTANCE: Final[str] = "CostPerInstance"
+    TOTAL_FLEET_COST: Final[str] = "TotalFleetCost"
 
 
-@dataclass(frozen=True)
 class DimensionNames:
     """CloudWatch dimension names."""
 
-    ENVIRONMENT: ClassVar[str] = "Environment"
-    FLEET_NAME: ClassVar[str] = "FleetName"
-    INSTANCE_TYPE: ClassVar[str] = "InstanceType"
-    AVAILABILITY_ZONE: ClassVar[str] = "AvailabilityZone"
-    INSTANCE_STATE: ClassVar[str] = "InstanceState"
-    COMPLIANCE_STATUS: ClassVar[str] = "ComplianceStatus"
+    ENVIRONMENT: Final[str] = "Environment"
+    FLEET_NAME: Final[str] = "FleetName"
+    INSTANCE_TYPE: Final[str] = "InstanceType"
+    AVAILABILITY_ZONE: Final[str] = "AvailabilityZone"
+    INSTANCE_STATE: Final[str] = "InstanceState"
+    COMPLIANCE_STATUS: Final[str] = "ComplianceStatus"
 
 
-@dataclass(frozen=True)
 class Thresholds:
     """Threshold values for health and compliance calculations.
 
@@ -78,36 +77,64 @@ class Thresholds:
     """
 
     # CPU utilization thresholds (percentage)
-    CPU_WARNING: ClassVar[float] = 70.0
-    CPU_CRITICAL: ClassVar[float] = 90.0
+    CPU_WARNING: Final[float] = 70.0
+    CPU_CRITICAL: Final[float] = 90.0
 
     # Memory utilization thresholds (percentage)
-    MEMORY_WARNING: ClassVar[float] = 75.0
-    MEMORY_CRITICAL: ClassVar[float] = 90.0
+    MEMORY_WARNING: Final[float] = 75.0
+    MEMORY_CRITICAL: Final[float] = 90.0
 
     # Disk utilization thresholds (percentage)
-    DISK_WARNING: ClassVar[float] = 80.0
-    DISK_CRITICAL: ClassVar[float] = 95.0
+    DISK_WARNING: Final[float] = 80.0
+    DISK_CRITICAL: Final[float] = 95.0
 
     # Compliance thresholds (percentage)
-    COMPLIANCE_WARNING: ClassVar[float] = 90.0
-    COMPLIANCE_CRITICAL: ClassVar[float] = 80.0
+    COMPLIANCE_WARNING: Final[float] = 90.0
+    COMPLIANCE_CRITICAL: Final[float] = 80.0
 
     # Health score weights
-    CPU_WEIGHT: ClassVar[float] = 0.30
-    MEMORY_WEIGHT: ClassVar[float] = 0.25
-    DISK_WEIGHT: ClassVar[float] = 0.20
-    COMPLIANCE_WEIGHT: ClassVar[float] = 0.25
+    CPU_WEIGHT: Final[float] = 0.30
+    MEMORY_WEIGHT: Final[float] = 0.25
+    DISK_WEIGHT: Final[float] = 0.20
+    COMPLIANCE_WEIGHT: Final[float] = 0.25
 
     # Cost efficiency thresholds
-    IDLE_CPU_THRESHOLD: ClassVar[float] = 5.0  # Below this is considered idle
-    UNDERUTILIZED_CPU_THRESHOLD: ClassVar[float] = 20.0
-
-
-@dataclass
+    IDLE_CPU_THRESHOLD: Final[float] = 5.0  # Below this is considered idle
+    UNDERUTILIZED_CPU_THRESHOLD: Final[float] = 20.0
+
+
+# Instance type to hourly cost mapping (USD).  These are approximate
+# on-demand prices for us-east-1.  Shared read-only by every Config.
+_COST_PER_HOUR: Mapping[str, float] = MappingProxyType({
+    "t3.micro": 0.0104,
+    "t3.small": 0.0208,
+    "t3.medium": 0.0416,
+    "t3.large": 0.0832,
+    "t3.xlarge": 0.1664,
+    "t3.2xlarge": 0.3328,
+    "m5.large": 0.096,
+    "m5.xlarge": 0.192,
+    "m5.2xlarge": 0.384,
+    "m5.4xlarge": 0.768,
+    "r5.large": 0.126,
+    "r5.xlarge": 0.252,
+    "r5.2xlarge": 0.504,
+    "c5.large": 0.085,
+    "c5.xlarge": 0.17,
+    "c5.2xlarge": 0.34,
+    # Default for unknown instance types
+    "default": 0.10,
+})
+_DEFAULT_COST_PER_HOUR = _COST_PER_HOUR["default"]
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main configuration class for the metric aggregator.
 
+    Instances are immutable; settings are read from the environment once
+    at construction.
+
     Attributes:
         environment: Deployment environment (dev, staging, production).
         region: AWS region for API calls.
@@ -116,9 +143,10 @@ class Config:
         aggregation_period_minutes: Period for metric aggregation.
         max_instances_per_query: Maximum instances to query at once.
         enable_detailed_metrics: Enable detailed per-instance metrics.
+        enable_compliance: Query SSM for per-instance patch compliance.
         log_level: Logging level for the function.
         ssm_inventory_type_name: SSM Inventory type to query.
-        cost_per_hour: Dictionary of instance type to hourly cost.
+        default_dimensions: Environment and FleetName metric dimensions.
     """
 
     environment: str = field(
@@ -147,6 +175,10 @@ class Config:
         ).lower()
         == "true"
     )
+    enable_compliance: bool = field(
+        default_factory=lambda: os.environ.get("ENABLE_COMPLIANCE", "true").lower()
+        == "true"
+    )
     log_level: str = field(
         default_factory=lambda: os.environ.get("LOG_LEVEL", "INFO")
     )
@@ -155,28 +187,22 @@ class Config:
             "SSM_INVENTORY_TYPE", "AWS:InstanceInformation"
         )
     )
-    # Instance type to hourly cost mapping (USD)
-    # These are approximate on-demand prices for us-east-1
-    cost_per_hour: dict[str, float] = field(default_factory=lambda: {
-        "t3.micro": 0.0104,
-        "t3.small": 0.0208,
-        "t3.medium": 0.0416,
-        "t3.large": 0.0832,
-        "t3.xlarge": 0.1664,
-        "t3.2xlarge": 0.3328,
-        "m5.large": 0.096,
-        "m5.xlarge": 0.192,
-        "m5.2xlarge": 0.384,
-        "m5.4xlarge": 0.768,
-        "r5.large": 0.126,
-        "r5.xlarge": 0.252,
-        "r5.2xlarge": 0.504,
-        "c5.large": 0.085,
-        "c5.xlarge": 0.17,
-        "c5.2xlarge": 0.34,
-        # Default for unknown instance types
-        "default": 0.10,
-    })
+    # Derived from environment / fleet_name in __post_init__
+    default_dimensions: tuple[dict[str, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Built once per Config rather than on every access; the instance
+        # is frozen, so assign through object.__setattr__.
+        object.__setattr__(
+            self,
+            "default_dimensions",
+            (
+                {"Name": DimensionNames.ENVIRONMENT, "Value": self.environment},
+                {"Name": DimensionNames.FLEET_NAME, "Value": self.fleet_name},
+            ),
+        )
 
     def get_instance_cost(self, instance_type: str) -> float:
         """Get hourly cost for an instance type.
@@ -187,31 +213,21 @@ def get_instance_cost(self, instance_type: str) -> float:
         Returns:
             Hourly cost in USD.
         """
-        return self.cost_per_hour.get(
-            instance_type, self.cost_per_hour.get("default", 0.10)
-        )
+        return _COST_PER_HOUR.get(instance_type, _DEFAULT_COST_PER_HOUR)
 
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.environment.lower() == Environment.PRODUCTION.value
 
-    @property
-    def default_dimensions(self) -> list[dict[str, str]]:
-        """Get default dimensions for metrics.
-
-        Returns:
-            List of dimension dictionaries.
-        """
-        return [
-            {"Name": DimensionNames.ENVIRONMENT, "Value": self.environment},
-            {"Name": DimensionNames.FLEET_NAME, "Value": self.fleet_name},
-        ]
-
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Factory function to create configuration instance.
 
+    The environment is fixed for the lifetime of a Lambda execution
+    environment, so the (immutable) Config is built once and shared.
+
     Returns:
         Configured Config instance based on environment variables.
     """
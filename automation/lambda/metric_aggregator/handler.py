@@ -12,22 +12,91 @@
 
 from __future__ import annotations
 
-from typing import Any
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
-from aws_lambda_powertools import Logger, Metrics, Tracer
+import orjson
+from aws_lambda_powertools import Logger, Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 from cloudwatch_client import CloudWatchClientError, CloudWatchMetricClient
-from config import MetricNamespace, get_config
-from metrics import ComplianceStatus, FleetMetrics, MetricAggregator
+from config import MetricNames, MetricNamespace, get_config
+from metrics import (
+    ComplianceStatus,
+    FleetMetrics,
+    InstanceMetrics,
+    MetricAggregator,
+    MetricValue,
+)
 from ssm_client import EC2InstanceClient, SSMClientError, SSMInventoryClient
 
+
+class _NoOpTracer:
+    """Stand-in for Powertools ``Tracer`` when tracing is disabled.
+
+    Constructing a real ``Tracer`` imports the X-Ray SDK even when tracing
+    is switched off, which costs ~100 ms of cold start for nothing.
+    """
+
+    def capture_method(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        return method
+
+    def capture_lambda_handler(self, handler: Callable[..., Any]) -> Callable[..., Any]:
+        return handler
+
+
+def _create_tracer() -> Any:
+    """Return a Powertools ``Tracer``, or a no-op when tracing is disabled."""
+    disabled = os.environ.get("POWERTOOLS_TRACE_DISABLED", "false").lower()
+    if disabled in ("1", "true", "yes", "on"):
+        return _NoOpTracer()
+
+    from aws_lambda_powertools import Tracer
+
+    return Tracer(service="hyperion-metric-aggregator")
+
+
+def _json_serializer(record: dict[str, Any]) -> str:
+    """Serialize a structured log record with orjson.
+
+    Falls back to ``str`` for unsupported types, matching the Powertools
+    default serializer.
+    """
+    return orjson.dumps(record, default=str).decode()
+
+
 # Initialize Lambda Powertools
-logger = Logger(service="hyperion-metric-aggregator")
-tracer = Tracer(service="hyperion-metric-aggregator")
+logger = Logger(
+    service="hyperion-metric-aggregator",
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
+tracer = _create_tracer()
 metrics = Metrics(namespace="Hyperion/FleetManager", service="metric-aggregator")
 
+# Created once per execution environment so warm invocations do not pay
+# for thread start-up.  One worker per independent collection query.
+_COLLECTOR_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="collect")
+
+# Configuration comes from environment variables, which are fixed for the
+# lifetime of the execution environment, so the config and the service
+# wrappers are built once at cold start and reused by warm invocations.
+_CONFIG = get_config()
+_EC2_CLIENT = EC2InstanceClient(_CONFIG)
+_SSM_CLIENT = SSMInventoryClient(_CONFIG)
+_CLOUDWATCH_CLIENT = CloudWatchMetricClient(_CONFIG)
+_AGGREGATOR = MetricAggregator(_CONFIG.environment, _CONFIG.fleet_name)
+
+# (namespace, metric name) pairs queried for every running instance, in
+# the order CPU, memory, disk
+_COLLECTED_METRICS: list[tuple[str, str]] = [
+    (MetricNamespace.EC2, "CPUUtilization"),
+    (MetricNamespace.CW_AGENT, "mem_used_percent"),
+    (MetricNamespace.CW_AGENT, "disk_used_percent"),
+]
+
 
 class MetricAggregationError(Exception):
     """Custom exception for metric aggregation failures."""
@@ -41,6 +110,7 @@ def collect_instance_metrics(
     ssm_client: SSMInventoryClient,
     cloudwatch_client: CloudWatchMetricClient,
     fleet_name: str,
+    enable_compliance: bool = True,
 ) -> FleetMetrics:
     """Collect metrics from all fleet instances.
 
@@ -49,6 +119,7 @@ def collect_instance_metrics(
         ssm_client: SSM inventory client.
         cloudwatch_client: CloudWatch metric client.
         fleet_name: Name of the fleet to query.
+        enable_compliance: Whether to query SSM for patch compliance.
 
     Returns:
         Aggregated fleet metrics.
@@ -56,7 +127,7 @@ def collect_instance_metrics(
     Raises:
         MetricAggregationError: If metric collection fails.
     """
-    logger.info("Starting metric collection", extra={"fleet_name": fleet_name})
+    logger.debug("Starting metric collection", extra={"fleet_name": fleet_name})
 
     try:
         # Get all instances in the fleet
@@ -66,55 +137,26 @@ def collect_instance_metrics(
             logger.warning("No instances found in fleet", extra={"fleet_name": fleet_name})
             return FleetMetrics()
 
-        # Get instance counts by state
-        state_counts = ec2_client.get_instance_counts_by_state(instances)
-
-        # Get running instance IDs for metric queries
-        running_instance_ids = [
-            i.instance_id for i in instances if i.state == "running"
-        ]
+        # Count instances by state and collect running IDs for the metric
+        # queries in a single pass
+        state_counts, running_instance_ids = ec2_client.summarize_instances(instances)
 
-        # Query CPU utilization from CloudWatch
-        cpu_metrics = {}
+        # Utilisation and compliance are only tracked for running
+        # instances; an idle fleet needs no further API calls.
+        compliance_data: dict[str, ComplianceStatus] = {}
         if running_instance_ids:
-            cpu_metrics = cloudwatch_client.query_instance_metrics(
-                instance_ids=running_instance_ids,
-                metric_name="CPUUtilization",
-                namespace=MetricNamespace.EC2,
+            compliance_data = _collect_running_metrics(
+                instances,
+                running_instance_ids,
+                ssm_client,
+                cloudwatch_client,
+                enable_compliance,
             )
 
-        # Query memory utilization from CloudWatch Agent
-        memory_metrics = cloudwatch_client.query_cw_agent_metrics(
-            instance_ids=running_instance_ids,
-            metric_name="mem_used_percent",
-        )
-
-        # Query disk utilization from CloudWatch Agent
-        disk_metrics = cloudwatch_client.query_cw_agent_metrics(
-            instance_ids=running_instance_ids,
-            metric_name="disk_used_percent",
-        )
-
-        # Get compliance data
-        compliance_data = ssm_client.get_instance_compliance(running_instance_ids)
-
-        # Update instance metrics with collected data
-        for instance in instances:
-            if instance.instance_id in cpu_metrics:
-                instance.cpu_utilization = cpu_metrics.get(instance.instance_id)
-            if instance.instance_id in memory_metrics:
-                instance.memory_utilization = memory_metrics.get(instance.instance_id)
-            if instance.instance_id in disk_metrics:
-                instance.disk_utilization = disk_metrics.get(instance.instance_id)
-            if instance.instance_id in compliance_data:
-                instance.is_compliant = (
-                    compliance_data[instance.instance_id] == ComplianceStatus.COMPLIANT
-                )
-
         # Calculate aggregated metrics
         fleet_metrics = _aggregate_instance_metrics(instances, state_counts, compliance_data)
 
-        logger.info(
+        logger.debug(
             "Metric collection complete",
             extra={
                 "total_instances": fleet_metrics.total_instances,
@@ -130,6 +172,75 @@ def collect_instance_metrics(
         raise MetricAggregationError(f"Metric collection failed: {e}") from e
 
 
+def _collect_running_metrics(
+    instances: list[InstanceMetrics],
+    running_instance_ids: list[str],
+    ssm_client: SSMInventoryClient,
+    cloudwatch_client: CloudWatchMetricClient,
+    enable_compliance: bool = True,
+) -> dict[str, ComplianceStatus]:
+    """Fetch utilisation and compliance for running instances and merge them.
+
+    Args:
+        instances: All fleet instances; running ones are updated in place.
+        running_instance_ids: IDs of the running instances.
+        ssm_client: SSM inventory client.
+        cloudwatch_client: CloudWatch metric client.
+        enable_compliance: Whether to query SSM for patch compliance.
+
+    Returns:
+        Compliance status keyed by running instance ID.
+    """
+    # CPU (EC2 namespace) and memory / disk (CloudWatch Agent) are
+    # fetched in a single batched GetMetricData pass.  That and the SSM
+    # compliance lookup are independent network calls, so run them
+    # concurrently; boto3 clients are safe to share across threads.
+    cloudwatch_future = _COLLECTOR_POOL.submit(
+        cloudwatch_client.query_many,
+        running_instance_ids,
+        _COLLECTED_METRICS,
+    )
+    compliance_future = (
+        _COLLECTOR_POOL.submit(ssm_client.get_instance_compliance, running_instance_ids)
+        if enable_compliance
+        else None
+    )
+
+    # Values per instance are ordered as in _COLLECTED_METRICS
+    utilization = cloudwatch_future.result()
+    compliance_data: dict[str, ComplianceStatus] = (
+        compliance_future.result() if compliance_future is not None else {}
+    )
+
+    # Update instance metrics with collected data.  Metrics are only
+    # queried for running instances, so skip the rest outright.
+    for instance in instances:
+        if instance.state != "running":
+            continue
+        instance_id = instance.instance_id
+        values = utilization.get(instance_id)
+        if values is not None:
+            (
+                instance.cpu_utilization,
+                instance.memory_utilization,
+                instance.disk_utilization,
+            ) = values
+        status = compliance_data.get(instance_id)
+        if status is not None:
+            instance.is_compliant = status == ComplianceStatus.COMPLIANT
+
+    return compliance_data
+
+
+def _round2(value: float) -> float:
+    """Round a non-negative value to two decimal places, half up.
+
+    Utilisation percentages are never negative, so integer scaling avoids
+    the general ``round(x, 2)`` path.
+    """
+    return int(value * 100 + 0.5) / 100
+
+
 def _aggregate_instance_metrics(
     instances: list,
     state_counts: dict[str, int],
@@ -140,7 +251,7 @@ def _aggregate_instance_metrics(
     Args:
         instances: List of instance metrics.
         state_counts: Dictionary of instance state counts.
-        compliance_data: Dictionary of instance compliance status.
+        compliance_data: Compliance status keyed by running instance ID.
 
     Returns:
         Aggregated fleet metrics.
@@ -153,50 +264,46 @@ def _aggregate_instance_metrics(
         instance_metrics=instances,
     )
 
-    # Calculate averages for running instances
-    running_instances = [i for i in instances if i.state == "running"]
-
-    if running_instances:
-        # CPU utilization average
-        cpu_values = [
-            i.cpu_utilization for i in running_instances if i.cpu_utilization is not None
-        ]
-        if cpu_values:
-            fleet_metrics.avg_cpu_utilization = round(
-                sum(cpu_values) / len(cpu_values), 2
-            )
-
-        # Memory utilization average
-        memory_values = [
-            i.memory_utilization
-            for i in running_instances
-            if i.memory_utilization is not None
-        ]
-        if memory_values:
-            fleet_metrics.avg_memory_utilization = round(
-                sum(memory_values) / len(memory_values), 2
-            )
-
-        # Disk utilization average
-        disk_values = [
-            i.disk_utilization
-            for i in running_instances
-            if i.disk_utilization is not None
-        ]
-        if disk_values:
-            fleet_metrics.avg_disk_utilization = round(
-                sum(disk_values) / len(disk_values), 2
-            )
-
-        # Calculate total hourly cost
-        fleet_metrics.total_hourly_cost = sum(i.hourly_cost for i in running_instances)
-
-    # Calculate compliance counts
-    for status in compliance_data.values():
+    # Accumulate averages, cost and compliance for running instances in a
+    # single pass.  Compliance is only queried for running instances, so
+    # it is looked up here rather than iterated separately.
+    cpu_sum = memory_sum = disk_sum = cost_sum = 0.0
+    cpu_count = memory_count = disk_count = 0
+    compliant = non_compliant = 0
+
+    for instance in instances:
+        if instance.state != "running":
+            continue
+
+        cpu = instance.cpu_utilization
+        if cpu is not None:
+            cpu_sum += cpu
+            cpu_count += 1
+        memory = instance.memory_utilization
+        if memory is not None:
+            memory_sum += memory
+            memory_count += 1
+        disk = instance.disk_utilization
+        if disk is not None:
+            disk_sum += disk
+            disk_count += 1
+        cost_sum += instance.hourly_cost
+
+        status = compliance_data.get(instance.instance_id)
         if status == ComplianceStatus.COMPLIANT:
-            fleet_metrics.compliant_instances += 1
+            compliant += 1
         elif status == ComplianceStatus.NON_COMPLIANT:
-            fleet_metrics.non_compliant_instances += 1
+            non_compliant += 1
+
+    if cpu_count:
+        fleet_metrics.avg_cpu_utilization = _round2(cpu_sum / cpu_count)
+    if memory_count:
+        fleet_metrics.avg_memory_utilization = _round2(memory_sum / memory_count)
+    if disk_count:
+        fleet_metrics.avg_disk_utilization = _round2(disk_sum / disk_count)
+    fleet_metrics.total_hourly_cost = cost_sum
+    fleet_metrics.compliant_instances = compliant
+    fleet_metrics.non_compliant_instances = non_compliant
 
     return fleet_metrics
 
@@ -204,15 +311,13 @@ def _aggregate_instance_metrics(
 @tracer.capture_method
 def publish_aggregated_metrics(
     cloudwatch_client: CloudWatchMetricClient,
-    aggregator: MetricAggregator,
-    fleet_metrics: FleetMetrics,
+    metric_values: list[MetricValue],
 ) -> int:
     """Publish aggregated metrics to CloudWatch.
 
     Args:
         cloudwatch_client: CloudWatch metric client.
-        aggregator: Metric aggregator instance.
-        fleet_metrics: Aggregated fleet metrics.
+        metric_values: Metric values produced by the aggregator.
 
     Returns:
         Number of metrics published.
@@ -220,16 +325,12 @@ def publish_aggregated_metrics(
     Raises:
         MetricAggregationError: If publishing fails.
     """
-    logger.info("Publishing aggregated metrics")
+    logger.debug("Publishing aggregated metrics")
 
     try:
-        # Generate metric values
-        metric_values = aggregator.aggregate(fleet_metrics)
-
-        # Publish to CloudWatch
         published_count = cloudwatch_client.publish_metrics(metric_values)
 
-        logger.info(
+        logger.debug(
             "Successfully published metrics",
             extra={"metric_count": published_count},
         )
@@ -243,7 +344,8 @@ def publish_aggregated_metrics(
 
 @metrics.log_metrics(capture_cold_start_metric=True)
 @tracer.capture_lambda_handler
-@logger.inject_lambda_context(log_event=True)
+# The scheduled event is static, so it is only worth logging when debugging
+@logger.inject_lambda_context(log_event=_CONFIG.log_level.upper() == "DEBUG")
 def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
     """Main Lambda handler for metric aggregation.
 
@@ -264,28 +366,32 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
     logger.info("Starting metric aggregation")
 
     try:
-        # Initialize configuration
-        config = get_config()
+        config = _CONFIG
         logger.append_keys(
             environment=config.environment,
             fleet_name=config.fleet_name,
         )
 
-        # Initialize clients
-        ec2_client = EC2InstanceClient(config)
-        ssm_client = SSMInventoryClient(config)
-        cloudwatch_client = CloudWatchMetricClient(config)
-        aggregator = MetricAggregator(config.environment, config.fleet_name)
+        # Clients are shared across invocations (see module scope)
+        ec2_client = _EC2_CLIENT
+        ssm_client = _SSM_CLIENT
+        cloudwatch_client = _CLOUDWATCH_CLIENT
+        aggregator = _AGGREGATOR
 
         # Collect metrics from all sources
         fleet_metrics = collect_instance_metrics(
-            ec2_client, ssm_client, cloudwatch_client, config.fleet_name
+            ec2_client,
+            ssm_client,
+            cloudwatch_client,
+            config.fleet_name,
+            enable_compliance=config.enable_compliance,
         )
 
-        # Publish aggregated metrics
-        published_count = publish_aggregated_metrics(
-            cloudwatch_client, aggregator, fleet_metrics
-        )
+        # Aggregate and publish.  The scores are computed once here and
+        # reused for the response below.
+        metric_values = aggregator.aggregate(fleet_metrics)
+        published_count = publish_aggregated_metrics(cloudwatch_client, metric_values)
+        values_by_name = {metric.name: metric.value for metric in metric_values}
 
         # Add custom metrics for Lambda Powertools
         metrics.add_metric(
@@ -304,12 +410,8 @@ def lambda_handler(event: dict[str, Any], context: LambdaContext) -> dict[str, A
                 "instances_processed": fleet_metrics.total_instances,
                 "running_instances": fleet_metrics.running_instances,
                 "metrics_published": published_count,
-                "fleet_health_score": aggregator.health_score_calculator.calculate(
-                    fleet_metrics
-                ),
-                "compliance_score": aggregator.compliance_score_calculator.calculate(
-                    fleet_metrics
-                ),
+                "fleet_health_score": values_by_name[MetricNames.FLEET_HEALTH_SCORE],
+                "compliance_score": values_by_name[MetricNames.COMPLIANCE_SCORE],
             },
         }
 
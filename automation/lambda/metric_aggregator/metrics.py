@@ -10,7 +10,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, Sequence
 
 from config import DimensionNames, MetricNames, Thresholds
 
@@ -32,7 +32,7 @@ class ComplianceStatus(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetricValue:
     """Represents a single metric value with metadata.
 
@@ -40,14 +40,14 @@ class MetricValue:
         name: Metric name.
         value: Metric value.
         unit: CloudWatch unit for the metric.
-        dimensions: List of dimension dictionaries.
+        dimensions: Dimension dictionaries; may be shared between metrics.
         timestamp: Metric timestamp.
     """
 
     name: str
     value: float
     unit: str = "None"
-    dimensions: list[dict[str, str]] = field(default_factory=list)
+    dimensions: Sequence[dict[str, str]] = field(default_factory=list)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_cloudwatch_format(self) -> dict[str, Any]:
@@ -65,7 +65,8 @@ def to_cloudwatch_format(self) -> dict[str, Any]:
         }
 
 
-@dataclass
+# Fleets can hold thousands of these, so drop the per-instance __dict__
+@dataclass(slots=True)
 class InstanceMetrics:
     """Metrics for a single instance.
 
@@ -207,8 +208,9 @@ def calculate(self, fleet_metrics: FleetMetrics) -> float:
 
         return round(min(100.0, max(0.0, health_score)), 2)
 
+    @staticmethod
     def _calculate_utilization_health(
-        self, utilization: float, warning_threshold: float, critical_threshold: float
+        utilization: float, warning_threshold: float, critical_threshold: float
     ) -> float:
         """Calculate health score from utilization metric.
 
@@ -334,25 +336,32 @@ def calculate(self, fleet_metrics: FleetMetrics) -> float:
         if fleet_metrics.running_instances == 0:
             return 0.0
 
+        # Extract the CPU column of running instances once, so the
+        # classification below compares plain floats instead of loading
+        # attributes from every instance object.
+        cpu_values = [
+            instance.cpu_utilization
+            for instance in fleet_metrics.instance_metrics
+            if instance.state == "running" and instance.cpu_utilization is not None
+        ]
+
+        total_running = len(cpu_values)
+        if total_running == 0:
+            return 50.0  # No data, assume neutral
+
         # Count underutilized and idle instances
+        idle_threshold = Thresholds.IDLE_CPU_THRESHOLD
+        underutilized_threshold = Thresholds.UNDERUTILIZED_CPU_THRESHOLD
         idle_count = 0
         underutilized_count = 0
-        well_utilized_count = 0
-
-        for instance in fleet_metrics.instance_metrics:
-            if instance.state != "running" or instance.cpu_utilization is None:
-                continue
 
-            if instance.cpu_utilization < Thresholds.IDLE_CPU_THRESHOLD:
+        for cpu in cpu_values:
+            if cpu < idle_threshold:
                 idle_count += 1
-            elif instance.cpu_utilization < Thresholds.UNDERUTILIZED_CPU_THRESHOLD:
+            elif cpu < underutilized_threshold:
                 underutilized_count += 1
-            else:
-                well_utilized_count += 1
 
-        total_running = idle_count + underutilized_count + well_utilized_count
-        if total_running == 0:
-            return 50.0  # No data, assume neutral
+        well_utilized_count = total_running - idle_count - underutilized_count
 
         # Calculate efficiency score
         # Well-utilized instances contribute fully, underutilized partially, idle minimally
@@ -452,10 +461,11 @@ def __init__(self, environment: str, fleet_name: str) -> None:
         """
         self.environment = environment
         self.fleet_name = fleet_name
-        self.default_dimensions = [
+        # One immutable sequence shared by reference by every MetricValue
+        self.default_dimensions: tuple[dict[str, str], ...] = (
             {"Name": DimensionNames.ENVIRONMENT, "Value": environment},
             {"Name": DimensionNames.FLEET_NAME, "Value": fleet_name},
-        ]
+        )
         self.health_score_calculator = FleetHealthScore()
         self.compliance_score_calculator = ComplianceScore()
         self.cost_efficiency_calculator = CostEfficiencyScore()
@@ -470,181 +480,132 @@ def aggregate(self, fleet_metrics: FleetMetrics) -> list[MetricValue]:
         Returns:
             List of MetricValue objects ready for CloudWatch.
         """
-        metrics: list[MetricValue] = []
         timestamp = datetime.now(timezone.utc)
+        dimensions = self.default_dimensions
 
-        # Instance count metrics
-        metrics.extend(self._create_instance_count_metrics(fleet_metrics, timestamp))
-
-        # Utilization metrics
-        metrics.extend(self._create_utilization_metrics(fleet_metrics, timestamp))
-
-        # Score metrics
-        metrics.extend(self._create_score_metrics(fleet_metrics, timestamp))
-
-        # Cost metrics
-        metrics.extend(self._create_cost_metrics(fleet_metrics, timestamp))
+        return [
+            MetricValue(name, value, unit, dimensions, timestamp)
+            for name, value, unit in self._metric_values(fleet_metrics)
+        ]
 
-        return metrics
+    def _metric_values(
+        self, fleet_metrics: FleetMetrics
+    ) -> tuple[tuple[str, float, str], ...]:
+        """Compute every aggregated metric as a (name, value, unit) row.
 
-    def _create_instance_count_metrics(
-        self, fleet_metrics: FleetMetrics, timestamp: datetime
-    ) -> list[MetricValue]:
-        """Create instance count metrics.
+        Rows are ordered instance counts, utilization, scores, then cost.
 
         Args:
             fleet_metrics: Fleet metrics.
-            timestamp: Metric timestamp.
 
         Returns:
-            List of instance count metrics.
+            Tuple of (metric name, value, CloudWatch unit) rows.
         """
-        return [
-            MetricValue(
-                name=MetricNames.INSTANCE_COUNT,
-                value=float(fleet_metrics.total_instances),
-                unit="Count",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.RUNNING_INSTANCES,
-                value=float(fleet_metrics.running_instances),
-                unit="Count",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.STOPPED_INSTANCES,
-                value=float(fleet_metrics.stopped_instances),
-                unit="Count",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.PENDING_INSTANCES,
-                value=float(fleet_metrics.pending_instances),
-                unit="Count",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-        ]
-
-    def _create_utilization_metrics(
-        self, fleet_metrics: FleetMetrics, timestamp: datetime
-    ) -> list[MetricValue]:
-        """Create utilization metrics.
+        (
+            health_score,
+            compliance_score,
+            cost_efficiency,
+            capacity_util,
+        ) = self._compute_all_scores(fleet_metrics)
+
+        total_instances = fleet_metrics.total_instances
+        running_instances = fleet_metrics.running_instances
+        stopped_instances = fleet_metrics.stopped_instances
+        pending_instances = fleet_metrics.pending_instances
+        avg_cpu = fleet_metrics.avg_cpu_utilization
+        avg_memory = fleet_metrics.avg_memory_utilization
+        avg_disk = fleet_metrics.avg_disk_utilization
+        total_hourly_cost = fleet_metrics.total_hourly_cost
+        cost_per_instance = (
+            total_hourly_cost / running_instances if running_instances > 0 else 0.0
+        )
 
-        Args:
-            fleet_metrics: Fleet metrics.
-            timestamp: Metric timestamp.
+        return (
+            # Instance counts
+            (MetricNames.INSTANCE_COUNT, float(total_instances), "Count"),
+            (MetricNames.RUNNING_INSTANCES, float(running_instances), "Count"),
+            (MetricNames.STOPPED_INSTANCES, float(stopped_instances), "Count"),
+            (MetricNames.PENDING_INSTANCES, float(pending_instances), "Count"),
+            # Utilization
+            (MetricNames.CPU_UTILIZATION, avg_cpu, "Percent"),
+            (MetricNames.MEMORY_UTILIZATION, avg_memory, "Percent"),
+            (MetricNames.DISK_UTILIZATION, avg_disk, "Percent"),
+            # Scores
+            (MetricNames.FLEET_HEALTH_SCORE, health_score, "Percent"),
+            (MetricNames.COMPLIANCE_SCORE, compliance_score, "Percent"),
+            (MetricNames.COST_EFFICIENCY_SCORE, cost_efficiency, "Percent"),
+            (MetricNames.CAPACITY_UTILIZATION, capacity_util, "Percent"),
+            # Cost, in USD per hour (no standard CloudWatch unit)
+            (MetricNames.COST_PER_INSTANCE, round(cost_per_instance, 4), "None"),
+            (MetricNames.TOTAL_FLEET_COST, round(total_hourly_cost, 4), "None"),
+        )
 
-        Returns:
-            List of utilization metrics.
-        """
-        return [
-            MetricValue(
-                name=MetricNames.CPU_UTILIZATION,
-                value=fleet_metrics.avg_cpu_utilization,
-                unit="Percent",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.MEMORY_UTILIZATION,
-                value=fleet_metrics.avg_memory_utilization,
-                unit="Percent",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.DISK_UTILIZATION,
-                value=fleet_metrics.avg_disk_utilization,
-                unit="Percent",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-        ]
+    def _compute_all_scores(
+        self, fleet_metrics: FleetMetrics
+    ) -> tuple[float, float, float, float]:
+        """Compute all four fleet scores in one pass over the aggregates.
 
-    def _create_score_metrics(
-        self, fleet_metrics: FleetMetrics, timestamp: datetime
-    ) -> list[MetricValue]:
-        """Create score metrics.
+        Produces the same values as the individual calculators, but reads
+        each fleet aggregate once and shares the compliance ratio between
+        the health and compliance scores.
 
         Args:
             fleet_metrics: Fleet metrics.
-            timestamp: Metric timestamp.
 
         Returns:
-            List of score metrics.
+            Tuple of (health, compliance, cost efficiency, capacity
+            utilization) scores.
         """
-        health_score = self.health_score_calculator.calculate(fleet_metrics)
-        compliance_score = self.compliance_score_calculator.calculate(fleet_metrics)
-        cost_efficiency = self.cost_efficiency_calculator.calculate(fleet_metrics)
-        capacity_util = self.capacity_utilization_calculator.calculate(fleet_metrics)
+        total_instances = fleet_metrics.total_instances
+        running_instances = fleet_metrics.running_instances
+        avg_cpu = fleet_metrics.avg_cpu_utilization
+        avg_memory = fleet_metrics.avg_memory_utilization
+        avg_disk = fleet_metrics.avg_disk_utilization
+
+        compliant = fleet_metrics.compliant_instances
+        total_checked = compliant + fleet_metrics.non_compliant_instances
+        if total_checked == 0:
+            compliance_percentage = 100.0  # No compliance data, assume healthy
+            compliance_score = 100.0
+        else:
+            compliance_percentage = (compliant / total_checked) * 100
+            compliance_score = round(compliance_percentage, 2)
 
-        return [
-            MetricValue(
-                name=MetricNames.FLEET_HEALTH_SCORE,
-                value=health_score,
-                unit="Percent",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.COMPLIANCE_SCORE,
-                value=compliance_score,
-                unit="Percent",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.COST_EFFICIENCY_SCORE,
-                value=cost_efficiency,
-                unit="Percent",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.CAPACITY_UTILIZATION,
-                value=capacity_util,
-                unit="Percent",
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-        ]
+        if total_instances == 0:
+            health_score = 0.0
+        else:
+            utilization_health = FleetHealthScore._calculate_utilization_health
+            weighted = (
+                utilization_health(
+                    avg_cpu, Thresholds.CPU_WARNING, Thresholds.CPU_CRITICAL
+                )
+                * Thresholds.CPU_WEIGHT
+                + utilization_health(
+                    avg_memory, Thresholds.MEMORY_WARNING, Thresholds.MEMORY_CRITICAL
+                )
+                * Thresholds.MEMORY_WEIGHT
+                + utilization_health(
+                    avg_disk, Thresholds.DISK_WARNING, Thresholds.DISK_CRITICAL
+                )
+                * Thresholds.DISK_WEIGHT
+                + compliance_percentage * Thresholds.COMPLIANCE_WEIGHT
+            )
+            health_score = round(min(100.0, max(0.0, weighted)), 2)
 
-    def _create_cost_metrics(
-        self, fleet_metrics: FleetMetrics, timestamp: datetime
-    ) -> list[MetricValue]:
-        """Create cost metrics.
+        if running_instances == 0:
+            return health_score, compliance_score, 0.0, 0.0
 
-        Args:
-            fleet_metrics: Fleet metrics.
-            timestamp: Metric timestamp.
+        # Cost efficiency needs the per-instance CPU values
+        cost_efficiency = self.cost_efficiency_calculator.calculate(fleet_metrics)
 
-        Returns:
-            List of cost metrics.
-        """
-        cost_per_instance = (
-            fleet_metrics.total_hourly_cost / fleet_metrics.running_instances
-            if fleet_metrics.running_instances > 0
-            else 0.0
+        metrics_count = 0
+        total_utilization = 0.0
+        for utilization in (avg_cpu, avg_memory, avg_disk):
+            if utilization > 0:
+                total_utilization += utilization
+                metrics_count += 1
+        capacity_util = (
+            round(total_utilization / metrics_count, 2) if metrics_count else 0.0
         )
 
-        return [
-            MetricValue(
-                name=MetricNames.COST_PER_INSTANCE,
-                value=round(cost_per_instance, 4),
-                unit="None",  # USD per hour, no standard unit
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-            MetricValue(
-                name=MetricNames.TOTAL_FLEET_COST,
-                value=round(fleet_metrics.total_hourly_cost, 4),
-                unit="None",  # USD per hour
-                dimensions=self.default_dimensions,
-                timestamp=timestamp,
-            ),
-        ]
+        return health_score, compliance_score, cost_efficiency, capacity_util
@@ -6,12 +6,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator
 
-import boto3
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
 
+from aws_clients import get_client
 from config import Config
 from metrics import ComplianceStatus, InstanceMetrics
 
@@ -35,6 +38,17 @@ class SSMInventoryClient:
     information and compliance data.
     """
 
+    # Concurrent per-instance compliance lookups; well within the shared
+    # client's connection pool.
+    MAX_COMPLIANCE_WORKERS = 16
+    # Largest page sizes the SSM APIs accept, to minimise round-trips
+    INSTANCE_INFORMATION_PAGE_SIZE = 50
+    INVENTORY_PAGE_SIZE = 50
+    COMPLIANCE_SUMMARY_PAGE_SIZE = 50
+    COMPLIANCE_ITEMS_PAGE_SIZE = 50
+    # describe_instance_patch_states limit on InstanceIds per request
+    PATCH_STATES_BATCH_SIZE = 50
+
     def __init__(self, config: Config) -> None:
         """Initialize the SSM client.
 
@@ -52,7 +66,7 @@ def client(self) -> SSMClient:
             Boto3 SSM client.
         """
         if self._client is None:
-            self._client = boto3.client("ssm", region_name=self.config.region)
+            self._client = get_client("ssm", self.config.region)
         return self._client
 
     def get_managed_instances(self) -> list[dict[str, Any]]:
@@ -64,8 +78,26 @@ def get_managed_instances(self) -> list[dict[str, Any]]:
         Raises:
             SSMClientError: If query fails.
         """
-        instances: list[dict[str, Any]] = []
+        instances = list(self.iter_managed_instances())
+
+        logger.info(
+            "Retrieved managed instances",
+            extra={"instance_count": len(instances)},
+        )
+        return instances
+
+    def iter_managed_instances(self) -> Iterator[dict[str, Any]]:
+        """Yield managed instances from SSM page by page.
 
+        Lets callers that only aggregate over the fleet consume instances
+        as each page arrives instead of materialising the full list.
+
+        Yields:
+            Managed instance information dictionaries.
+
+        Raises:
+            SSMClientError: If query fails.
+        """
         try:
             paginator = self.client.get_paginator("describe_instance_information")
 
@@ -74,9 +106,12 @@ def get_managed_instances(self) -> list[dict[str, Any]]:
                 {"Key": "ResourceType", "Values": ["EC2Instance"]},
             ]
 
-            for page in paginator.paginate(Filters=filters):
+            for page in paginator.paginate(
+                Filters=filters,
+                PaginationConfig={"PageSize": self.INSTANCE_INFORMATION_PAGE_SIZE},
+            ):
                 for instance_info in page.get("InstanceInformationList", []):
-                    instances.append({
+                    yield {
                         "instance_id": instance_info.get("InstanceId", ""),
                         "ping_status": instance_info.get("PingStatus", "Unknown"),
                         "platform_type": instance_info.get("PlatformType", "Unknown"),
@@ -87,13 +122,7 @@ def get_managed_instances(self) -> list[dict[str, Any]]:
                         "computer_name": instance_info.get("ComputerName", ""),
                         "ip_address": instance_info.get("IPAddress", ""),
                         "resource_type": instance_info.get("ResourceType", ""),
-                    })
-
-            logger.info(
-                "Retrieved managed instances",
-                extra={"instance_count": len(instances)},
-            )
-            return instances
+                    }
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
@@ -135,7 +164,10 @@ def get_inventory(
 
             paginator = self.client.get_paginator("get_inventory")
 
-            for page in paginator.paginate(Filters=filters if filters else []):
+            for page in paginator.paginate(
+                Filters=filters if filters else [],
+                PaginationConfig={"PageSize": self.INVENTORY_PAGE_SIZE},
+            ):
                 for entity in page.get("Entities", []):
                     instance_id = entity.get("Id", "")
                     content = entity.get("Data", {})
@@ -177,15 +209,7 @@ def get_compliance_summary(self) -> dict[str, int]:
             SSMClientError: If query fails.
         """
         try:
-            response = self.client.list_resource_compliance_summaries(
-                Filters=[
-                    {
-                        "Key": "ComplianceType",
-                        "Values": ["Association", "Patch"],
-                        "Type": "EQUAL",
-                    }
-                ]
-            )
+            paginator = self.client.get_paginator("list_resource_compliance_summaries")
 
             summary = {
                 "compliant": 0,
@@ -193,14 +217,25 @@ def get_compliance_summary(self) -> dict[str, int]:
                 "unknown": 0,
             }
 
-            for item in response.get("ResourceComplianceSummaryItems", []):
-                status = item.get("Status", "UNKNOWN").upper()
-                if status == "COMPLIANT":
-                    summary["compliant"] += 1
-                elif status == "NON_COMPLIANT":
-                    summary["non_compliant"] += 1
-                else:
-                    summary["unknown"] += 1
+            # Count page by page; summaries span many pages in large accounts
+            for page in paginator.paginate(
+                Filters=[
+                    {
+                        "Key": "ComplianceType",
+                        "Values": ["Association", "Patch"],
+                        "Type": "EQUAL",
+                    }
+                ],
+                PaginationConfig={"PageSize": self.COMPLIANCE_SUMMARY_PAGE_SIZE},
+            ):
+                for item in page.get("ResourceComplianceSummaryItems", []):
+                    status = item.get("Status", "UNKNOWN").upper()
+                    if status == "COMPLIANT":
+                        summary["compliant"] += 1
+                    elif status == "NON_COMPLIANT":
+                        summary["non_compliant"] += 1
+                    else:
+                        summary["unknown"] += 1
 
             logger.info("Retrieved compliance summary", extra={"summary": summary})
             return summary
@@ -226,65 +261,83 @@ def get_instance_compliance(
 
         Returns:
             Dictionary mapping instance ID to compliance status.
-
-        Raises:
-            SSMClientError: If query fails.
         """
-        compliance_map: dict[str, ComplianceStatus] = {
-            iid: ComplianceStatus.UNKNOWN for iid in instance_ids
-        }
-
         if not instance_ids:
-            return compliance_map
+            return {}
+
+        # One paginated request chain per instance; these are independent
+        # network calls, so fan them out over the shared client.
+        if len(instance_ids) == 1:
+            statuses = [self._compliance_for_one(instance_ids[0])]
+        else:
+            workers = min(self.MAX_COMPLIANCE_WORKERS, len(instance_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                statuses = list(executor.map(self._compliance_for_one, instance_ids))
+
+        logger.debug(
+            "Retrieved instance compliance",
+            extra={"instance_count": len(instance_ids)},
+        )
+        return dict(zip(instance_ids, statuses))
+
+    def _compliance_for_one(self, instance_id: str) -> ComplianceStatus:
+        """Get the compliance status of a single instance.
+
+        Any non-compliant item makes the instance non-compliant; otherwise
+        it is compliant if at least one compliant item exists.  Both checks
+        filter on status server-side and return on the first matching page,
+        so the usual cost is two requests; an extra request is only paid for
+        each empty filtered page that still carries a ``NextToken``.
 
-        try:
-            paginator = self.client.get_paginator("list_compliance_items")
-
-            for instance_id in instance_ids:
-                try:
-                    # Get compliance items for this instance
-                    for page in paginator.paginate(
-                        ResourceIds=[instance_id],
-                        ResourceTypes=["ManagedInstance"],
-                    ):
-                        for item in page.get("ComplianceItems", []):
-                            status = item.get("Status", "UNKNOWN").upper()
-                            if status == "NON_COMPLIANT":
-                                # Any non-compliant item makes the instance non-compliant
-                                compliance_map[instance_id] = ComplianceStatus.NON_COMPLIANT
-                                break
-                            elif status == "COMPLIANT":
-                                # Set to compliant only if not already non-compliant
-                                if compliance_map[instance_id] == ComplianceStatus.UNKNOWN:
-                                    compliance_map[instance_id] = ComplianceStatus.COMPLIANT
-
-                except ClientError as e:
-                    # Log but continue with other instances
-                    logger.warning(
-                        "Failed to get compliance for instance",
-                        extra={
-                            "instance_id": instance_id,
-                            "error": str(e),
-                        },
-                    )
-                    continue
+        Args:
+            instance_id: Instance ID to check.
 
-            logger.debug(
-                "Retrieved instance compliance",
-                extra={"instance_count": len(instance_ids)},
-            )
-            return compliance_map
+        Returns:
+            Compliance status, ``UNKNOWN`` if none could be determined.
+        """
+        try:
+            if self._has_compliance_item(instance_id, "NON_COMPLIANT"):
+                return ComplianceStatus.NON_COMPLIANT
+            if self._has_compliance_item(instance_id, "COMPLIANT"):
+                return ComplianceStatus.COMPLIANT
 
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(
-                "Failed to get instance compliance",
-                extra={"error_code": error_code, "error_message": error_message},
+            # Log but continue with other instances
+            logger.warning(
+                "Failed to get compliance for instance",
+                extra={
+                    "instance_id": instance_id,
+                    "error": str(e),
+                },
             )
-            raise SSMClientError(
-                f"Failed to get instance compliance: {error_code} - {error_message}"
-            ) from e
+
+        return ComplianceStatus.UNKNOWN
+
+    def _has_compliance_item(self, instance_id: str, status: str) -> bool:
+        """Check whether an instance has any compliance item with a status.
+
+        Args:
+            instance_id: Instance ID to check.
+            status: Compliance status to look for.
+
+        Returns:
+            True as soon as one matching item is found.
+        """
+        kwargs: dict[str, Any] = {
+            "ResourceIds": [instance_id],
+            "ResourceTypes": ["ManagedInstance"],
+            "Filters": [{"Key": "Status", "Values": [status], "Type": "EQUAL"}],
+            "MaxResults": self.COMPLIANCE_ITEMS_PAGE_SIZE,
+        }
+        while True:
+            response = self.client.list_compliance_items(**kwargs)
+            if response.get("ComplianceItems"):
+                return True
+            # Filtered pages can come back empty with more to follow
+            next_token = response.get("NextToken")
+            if not next_token:
+                return False
+            kwargs["NextToken"] = next_token
 
     def get_patch_compliance(self, instance_ids: list[str]) -> dict[str, dict[str, Any]]:
         """Get patch compliance details for instances.
@@ -294,59 +347,93 @@ def get_patch_compliance(self, instance_ids: list[str]) -> dict[str, dict[str, A
 
         Returns:
             Dictionary mapping instance ID to patch compliance details.
-
-        Raises:
-            SSMClientError: If query fails.
+            Instances without patch state are omitted.
         """
+        if not instance_ids:
+            return {}
+
+        # describe_instance_patch_states takes up to 50 IDs per request, so
+        # query in batches and run the batches concurrently.
+        batch_size = self.PATCH_STATES_BATCH_SIZE
+        batches = [
+            instance_ids[i : i + batch_size]
+            for i in range(0, len(instance_ids), batch_size)
+        ]
+
+        if len(batches) == 1:
+            batch_results = [self._patch_states_for_batch(batches[0])]
+        else:
+            workers = min(self.MAX_COMPLIANCE_WORKERS, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_results = list(executor.map(self._patch_states_for_batch, batches))
+
         patch_compliance: dict[str, dict[str, Any]] = {}
+        for batch_result in batch_results:
+            patch_compliance.update(batch_result)
+        return patch_compliance
+
+    def _patch_states_for_batch(
+        self, instance_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Get patch states for up to ``PATCH_STATES_BATCH_SIZE`` instances.
 
+        Args:
+            instance_ids: Instance IDs in this batch.
+
+        Returns:
+            Dictionary mapping instance ID to patch compliance details;
+            zeroed counts for every instance if the lookup failed.
+        """
+        patch_compliance: dict[str, dict[str, Any]] = {}
         try:
-            for instance_id in instance_ids:
-                try:
-                    response = self.client.describe_instance_patch_states(
-                        InstanceIds=[instance_id]
-                    )
-
-                    for patch_state in response.get("InstancePatchStates", []):
-                        patch_compliance[instance_id] = {
-                            "installed_count": patch_state.get("InstalledCount", 0),
-                            "installed_other_count": patch_state.get(
-                                "InstalledOtherCount", 0
-                            ),
-                            "missing_count": patch_state.get("MissingCount", 0),
-                            "failed_count": patch_state.get("FailedCount", 0),
-                            "not_applicable_count": patch_state.get(
-                                "NotApplicableCount", 0
-                            ),
-                            "operation": patch_state.get("Operation", "Unknown"),
-                            "operation_end_time": patch_state.get("OperationEndTime"),
-                        }
-
-                except ClientError:
-                    # Instance may not have patch data
-                    patch_compliance[instance_id] = {
-                        "installed_count": 0,
-                        "missing_count": 0,
-                        "failed_count": 0,
+            paginator = self.client.get_paginator("describe_instance_patch_states")
+            for page in paginator.paginate(
+                InstanceIds=instance_ids,
+                PaginationConfig={"PageSize": self.PATCH_STATES_BATCH_SIZE},
+            ):
+                for patch_state in page.get("InstancePatchStates", []):
+                    patch_compliance[patch_state["InstanceId"]] = {
+                        "installed_count": patch_state.get("InstalledCount", 0),
+                        "installed_other_count": patch_state.get(
+                            "InstalledOtherCount", 0
+                        ),
+                        "missing_count": patch_state.get("MissingCount", 0),
+                        "failed_count": patch_state.get("FailedCount", 0),
+                        "not_applicable_count": patch_state.get(
+                            "NotApplicableCount", 0
+                        ),
+                        "operation": patch_state.get("Operation", "Unknown"),
+                        "operation_end_time": patch_state.get("OperationEndTime"),
                     }
 
-            return patch_compliance
-
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
-            logger.error(
-                "Failed to get patch compliance",
-                extra={"error_code": error_code, "error_message": error_message},
+            # Instances may not have patch data
+            logger.warning(
+                "Failed to get patch states",
+                extra={"instance_count": len(instance_ids), "error": str(e)},
             )
-            raise SSMClientError(
-                f"Failed to get patch compliance: {error_code} - {error_message}"
-            ) from e
+            return {
+                instance_id: {
+                    "installed_count": 0,
+                    "missing_count": 0,
+                    "failed_count": 0,
+                }
+                for instance_id in instance_ids
+            }
+
+        return patch_compliance
 
 
 class EC2InstanceClient:
     """Client for EC2 instance information not available through SSM."""
 
+    # Largest page size describe_instances accepts with filters
+    DESCRIBE_INSTANCES_PAGE_SIZE = 1000
+    # Terminated and shutting-down instances linger in describe_instances
+    # for up to an hour; they are no longer part of the fleet, so leave
+    # them out server-side.
+    FLEET_INSTANCE_STATES = ["pending", "running", "stopping", "stopped"]
+
     def __init__(self, config: Config) -> None:
         """Initialize the EC2 client.
 
@@ -360,7 +447,7 @@ def __init__(self, config: Config) -> None:
     def client(self):
         """Get or create the EC2 client."""
         if self._client is None:
-            self._client = boto3.client("ec2", region_name=self.config.region)
+            self._client = get_client("ec2", self.config.region)
         return self._client
 
     def get_fleet_instances(self, fleet_name: str) -> list[InstanceMetrics]:
@@ -376,30 +463,53 @@ def get_fleet_instances(self, fleet_name: str) -> list[InstanceMetrics]:
             SSMClientError: If query fails.
         """
         instances: list[InstanceMetrics] = []
+        cost_by_type: dict[str, float] = {}
 
         try:
             paginator = self.client.get_paginator("describe_instances")
 
-            # Filter by fleet tag
+            # Filter by fleet tag and live instance states
             filters = [
                 {
                     "Name": "tag:Fleet",
                     "Values": [fleet_name],
                 },
+                {
+                    "Name": "instance-state-name",
+                    "Values": self.FLEET_INSTANCE_STATES,
+                },
             ]
 
-            for page in paginator.paginate(Filters=filters):
+            for page in paginator.paginate(
+                Filters=filters,
+                PaginationConfig={"PageSize": self.DESCRIBE_INSTANCES_PAGE_SIZE},
+            ):
                 for reservation in page.get("Reservations", []):
                     for instance in reservation.get("Instances", []):
                         instance_id = instance.get("InstanceId", "")
-                        instance_type = instance.get("InstanceType", "unknown")
-                        state = instance.get("State", {}).get("Name", "unknown")
-                        az = instance.get("Placement", {}).get(
-                            "AvailabilityZone", "unknown"
+                        # Types, states and AZs repeat across the fleet, so
+                        # intern them to share one string object per value.
+                        instance_type = sys.intern(
+                            instance.get("InstanceType", "unknown")
+                        )
+                        state = sys.intern(
+                            instance.get("State", {}).get("Name", "unknown")
+                        )
+                        az = sys.intern(
+                            instance.get("Placement", {}).get(
+                                "AvailabilityZone", "unknown"
+                            )
                         )
 
-                        # Calculate hourly cost
-                        hourly_cost = self.config.get_instance_cost(instance_type)
+                        # Only running instances accrue cost; look it up
+                        # once per distinct instance type.
+                        hourly_cost = 0.0
+                        if state == "running":
+                            hourly_cost = cost_by_type.get(instance_type)
+                            if hourly_cost is None:
+                                hourly_cost = cost_by_type[instance_type] = (
+                                    self.config.get_instance_cost(instance_type)
+                                )
 
                         instances.append(
                             InstanceMetrics(
@@ -407,7 +517,7 @@ def get_fleet_instances(self, fleet_name: str) -> list[InstanceMetrics]:
                                 instance_type=instance_type,
                                 availability_zone=az,
                                 state=state,
-                                hourly_cost=hourly_cost if state == "running" else 0.0,
+                                hourly_cost=hourly_cost,
                             )
                         )
 
@@ -443,20 +553,32 @@ def get_instance_counts_by_state(
         Returns:
             Dictionary mapping state to count.
         """
-        counts: dict[str, int] = {
-            "running": 0,
-            "stopped": 0,
-            "pending": 0,
-            "stopping": 0,
-            "terminated": 0,
-            "shutting-down": 0,
-        }
+        return self.summarize_instances(instances)[0]
 
-        for instance in instances:
-            state = instance.state.lower()
-            if state in counts:
-                counts[state] += 1
-            else:
-                counts[state] = 1
+    def summarize_instances(
+        self, instances: list[InstanceMetrics]
+    ) -> tuple[dict[str, int], list[str]]:
+        """Count instances by state and collect running IDs.
 
-        return counts
+        Args:
+            instances: List of instance metrics.
+
+        Returns:
+            Tuple of (state to count mapping, running instance IDs).
+        """
+        states = [instance.state.lower() for instance in instances]
+
+        # Known states always appear, in this order, followed by any others
+        counts: dict[str, int] = dict.fromkeys(
+            ("running", "stopped", "pending", "stopping", "terminated", "shutting-down"),
+            0,
+        )
+        counts.update(Counter(states))
+
+        running_ids = [
+            instance.instance_id
+            for instance, state in zip(instances, states)
+            if state == "running"
+        ]
+
+        return counts, running_ids
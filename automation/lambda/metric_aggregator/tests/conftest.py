@@ -469,6 +469,10 @@ def mock_ec2_instance_client(mock_config: Any) -> Any:
         "stopped": 0,
         "pending": 0,
     }
+    mock_client.summarize_instances.return_value = (
+        mock_client.get_instance_counts_by_state.return_value,
+        ["i-1", "i-2"],
+    )
 
     return mock_client
 
@@ -514,6 +518,10 @@ def mock_cloudwatch_metric_client(mock_config: Any) -> Any:
         "i-1": 60.0,
         "i-2": 55.0,
     }
+    mock_client.query_many.return_value = {
+        "i-1": [45.5, 60.0, 60.0],
+        "i-2": [50.0, 55.0, 55.0],
+    }
     mock_client.publish_metrics.return_value = 10
 
     return mock_client
@@ -486,18 +486,34 @@ def test_publish_metrics_batching(self, config: Config) -> None:
 
         client = CloudWatchMetricClient(config)
 
-        # Create more than 20 metrics to test batching
+        # Create more than one batch worth of metrics to test batching
+        total = client.MAX_METRICS_PER_BATCH + 25
         metrics = [
             MetricValue(
                 name=f"TestMetric{i}",
                 value=float(i),
                 unit="Count",
             )
-            for i in range(25)
+            for i in range(total)
         ]
 
         count = client.publish_metrics(metrics)
-        assert count == 25
+        assert count == total
+
+    def test_publish_batch_size_respects_payload_limit(self, config: Config) -> None:
+        """Test that heavily dimensioned metrics are sent in smaller batches."""
+        from cloudwatch_client import CloudWatchMetricClient
+
+        client = CloudWatchMetricClient(config)
+        dimensions = [{"Name": f"Dim{i}", "Value": "value"} for i in range(30)]
+        metrics = [MetricValue(name="TestMetric", value=1.0, dimensions=dimensions)]
+
+        batch_size = client._publish_batch_size(metrics)
+
+        assert batch_size < client.MAX_METRICS_PER_BATCH
+        assert batch_size * (
+            client.DATUM_ESTIMATED_BYTES + 30 * client.DIMENSION_ESTIMATED_BYTES
+        ) <= client.MAX_PUBLISH_PAYLOAD_BYTES
 
     def test_publish_empty_metrics(self, config: Config) -> None:
         """Test publishing empty metric list."""
@@ -507,6 +523,132 @@ def test_publish_empty_metrics(self, config: Config) -> None:
         count = client.publish_metrics([])
         assert count == 0
 
+    def test_publish_metrics_batch_failure_raises(self, config: Config) -> None:
+        """Test that a failed batch surfaces as CloudWatchClientError."""
+        from botocore.exceptions import ClientError
+
+        from cloudwatch_client import CloudWatchClientError, CloudWatchMetricClient
+
+        client = CloudWatchMetricClient(config)
+        client._client = MagicMock()
+        client._client.put_metric_data.side_effect = ClientError(
+            {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+            "PutMetricData",
+        )
+
+        total = client.MAX_METRICS_PER_BATCH * 2 + 5
+        metrics = [MetricValue(name=f"TestMetric{i}", value=float(i)) for i in range(total)]
+
+        with pytest.raises(CloudWatchClientError, match="Throttling"):
+            client.publish_metrics(metrics)
+
+    def test_publish_metrics_bounds_batches_in_flight(self, config: Config) -> None:
+        """Test that later batches are not converted once a batch fails."""
+        from botocore.exceptions import ClientError
+
+        from cloudwatch_client import CloudWatchClientError, CloudWatchMetricClient
+
+        client = CloudWatchMetricClient(config)
+        client.MAX_METRICS_PER_BATCH = 1
+        client._client = MagicMock()
+        client._client.put_metric_data.side_effect = ClientError(
+            {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+            "PutMetricData",
+        )
+
+        total = client.MAX_PUBLISH_WORKERS * 3
+        metrics = [MetricValue(name=f"TestMetric{i}", value=float(i)) for i in range(total)]
+
+        with patch.object(
+            MetricValue, "to_cloudwatch_format", autospec=True, return_value={}
+        ) as to_cloudwatch_format:
+            with pytest.raises(CloudWatchClientError):
+                client.publish_metrics(metrics)
+
+        assert to_cloudwatch_format.call_count == client.MAX_PUBLISH_WORKERS
+        assert client._client.put_metric_data.call_count == client.MAX_PUBLISH_WORKERS
+
+    def test_query_instance_metrics_builds_per_instance_queries(
+        self, config: Config
+    ) -> None:
+        """Test that each instance gets its own query with shared stat settings."""
+        from cloudwatch_client import CloudWatchMetricClient
+
+        client = CloudWatchMetricClient(config)
+        client._client = MagicMock()
+        client._client.get_metric_data.return_value = {"MetricDataResults": []}
+
+        client.query_instance_metrics(
+            ["i-a", "i-b"], "CPUUtilization", period=60, stat="Maximum"
+        )
+
+        queries = client._client.get_metric_data.call_args.kwargs["MetricDataQueries"]
+        assert [q["Id"] for q in queries] == ["m0", "m1"]
+        for query, instance_id in zip(queries, ["i-a", "i-b"]):
+            metric_stat = query["MetricStat"]
+            assert metric_stat["Period"] == 60
+            assert metric_stat["Stat"] == "Maximum"
+            assert metric_stat["Metric"]["MetricName"] == "CPUUtilization"
+            assert metric_stat["Metric"]["Dimensions"] == [
+                {"Name": "InstanceId", "Value": instance_id}
+            ]
+
+    def test_query_instance_metrics_maps_results_across_batches(
+        self, config: Config
+    ) -> None:
+        """Test that results in later batches map back to the right instance."""
+        from cloudwatch_client import CloudWatchMetricClient
+
+        instance_ids = [f"i-{idx:04d}" for idx in range(501)]
+
+        def get_metric_data(**kwargs: Any) -> dict[str, Any]:
+            return {
+                "MetricDataResults": [
+                    {"Id": q["Id"], "Values": [float(q["Id"][1:])]}
+                    for q in kwargs["MetricDataQueries"]
+                ]
+            }
+
+        client = CloudWatchMetricClient(config)
+        client._client = MagicMock()
+        client._client.get_metric_data.side_effect = get_metric_data
+
+        results = client.query_instance_metrics(instance_ids, "CPUUtilization")
+
+        assert client._client.get_metric_data.call_count == 2
+        assert results["i-0000"] == 0.0
+        assert results["i-0500"] == 500.0
+        assert all(value is not None for value in results.values())
+
+    def test_query_many_batches_all_metrics_together(self, config: Config) -> None:
+        """Test that several metrics are fetched in one call, ordered per instance."""
+        from cloudwatch_client import CloudWatchMetricClient
+
+        client = CloudWatchMetricClient(config)
+        client._client = MagicMock()
+        client._client.get_metric_data.return_value = {
+            "MetricDataResults": [
+                {"Id": "m0", "Values": [10.0]},
+                {"Id": "m1", "Values": [20.0]},
+                {"Id": "m2", "Values": [30.0]},
+            ]
+        }
+
+        results = client.query_many(
+            ["i-a", "i-b"],
+            [("AWS/EC2", "CPUUtilization"), ("CWAgent", "mem_used_percent")],
+        )
+
+        assert client._client.get_metric_data.call_count == 1
+        queries = client._client.get_metric_data.call_args.kwargs["MetricDataQueries"]
+        assert [q["MetricStat"]["Metric"]["Namespace"] for q in queries] == [
+            "AWS/EC2",
+            "AWS/EC2",
+            "CWAgent",
+            "CWAgent",
+        ]
+        assert results == {"i-a": [10.0, 30.0], "i-b": [20.0, None]}
+
 
 @mock_aws
 class TestSSMClient:
@@ -526,6 +668,135 @@ def test_get_managed_instances_empty(self, config: Config) -> None:
         assert instances == []
 
 
+class TestSSMCompliance:
+    """Tests for SSM compliance lookups against a stubbed client."""
+
+    def test_get_instance_compliance_per_instance(self, config: Config) -> None:
+        """Test that compliance is resolved independently for each instance."""
+        from botocore.exceptions import ClientError
+
+        from ssm_client import SSMInventoryClient
+
+        statuses = {
+            "i-ok": {"COMPLIANT"},
+            "i-bad": {"COMPLIANT", "NON_COMPLIANT"},
+            "i-none": set(),
+        }
+
+        def list_compliance_items(
+            ResourceIds: list[str], Filters: list[dict[str, Any]], **kwargs: Any
+        ) -> dict[str, Any]:
+            instance_id = ResourceIds[0]
+            if instance_id == "i-err":
+                raise ClientError({"Error": {"Code": "Throttling"}}, "ListComplianceItems")
+            status = Filters[0]["Values"][0]
+            # An empty first page with a token must be followed
+            if "NextToken" not in kwargs:
+                return {"ComplianceItems": [], "NextToken": "next"}
+            if status in statuses[instance_id]:
+                return {"ComplianceItems": [{"Status": status}]}
+            return {"ComplianceItems": []}
+
+        client = SSMInventoryClient(config)
+        client._client = MagicMock()
+        client._client.list_compliance_items.side_effect = list_compliance_items
+
+        compliance = client.get_instance_compliance(["i-ok", "i-bad", "i-none", "i-err"])
+
+        assert compliance == {
+            "i-ok": ComplianceStatus.COMPLIANT,
+            "i-bad": ComplianceStatus.NON_COMPLIANT,
+            "i-none": ComplianceStatus.UNKNOWN,
+            "i-err": ComplianceStatus.UNKNOWN,
+        }
+
+    def test_get_instance_compliance_follows_empty_filtered_pages(
+        self, config: Config
+    ) -> None:
+        """Test that a non-compliant item several token hops in is still found."""
+        from ssm_client import SSMInventoryClient
+
+        pages = {
+            None: {"ComplianceItems": [], "NextToken": "t1"},
+            "t1": {"ComplianceItems": [], "NextToken": "t2"},
+            "t2": {"ComplianceItems": [], "NextToken": "t3"},
+            "t3": {"ComplianceItems": [{"Status": "NON_COMPLIANT"}]},
+        }
+
+        def list_compliance_items(**kwargs: Any) -> dict[str, Any]:
+            assert kwargs["Filters"][0]["Values"] == ["NON_COMPLIANT"]
+            return pages[kwargs.get("NextToken")]
+
+        client = SSMInventoryClient(config)
+        client._client = MagicMock()
+        client._client.list_compliance_items.side_effect = list_compliance_items
+
+        compliance = client.get_instance_compliance(["i-bad"])
+
+        assert compliance == {"i-bad": ComplianceStatus.NON_COMPLIANT}
+        calls = client._client.list_compliance_items.call_args_list
+        assert len(calls) == len(pages)
+        assert all(
+            call.kwargs["MaxResults"] == client.COMPLIANCE_ITEMS_PAGE_SIZE
+            for call in calls
+        )
+
+    def test_get_compliance_summary_counts_all_pages(self, config: Config) -> None:
+        """Test that the compliance summary covers every page of results."""
+        from ssm_client import SSMInventoryClient
+
+        client = SSMInventoryClient(config)
+        client._client = MagicMock()
+        client._client.get_paginator.return_value.paginate.return_value = [
+            {"ResourceComplianceSummaryItems": [{"Status": "COMPLIANT"}] * 50},
+            {
+                "ResourceComplianceSummaryItems": [
+                    {"Status": "COMPLIANT"},
+                    {"Status": "NON_COMPLIANT"},
+                    {},
+                ]
+            },
+        ]
+
+        summary = client.get_compliance_summary()
+
+        client._client.get_paginator.assert_called_once_with(
+            "list_resource_compliance_summaries"
+        )
+        assert summary == {"compliant": 51, "non_compliant": 1, "unknown": 1}
+
+    def test_get_patch_compliance_batches_instance_ids(self, config: Config) -> None:
+        """Test that patch states are requested 50 instances at a time."""
+        from ssm_client import SSMInventoryClient
+
+        def paginate(InstanceIds: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+            return [
+                {
+                    "InstancePatchStates": [
+                        {"InstanceId": iid, "MissingCount": 2}
+                        for iid in InstanceIds
+                        if iid != "i-0"
+                    ]
+                }
+            ]
+
+        client = SSMInventoryClient(config)
+        client._client = MagicMock()
+        paginator = client._client.get_paginator.return_value
+        paginator.paginate.side_effect = paginate
+
+        instance_ids = [f"i-{n}" for n in range(120)]
+        patch_compliance = client.get_patch_compliance(instance_ids)
+
+        batch_sizes = sorted(
+            len(call.kwargs["InstanceIds"]) for call in paginator.paginate.call_args_list
+        )
+        assert batch_sizes == [20, 50, 50]
+        assert len(patch_compliance) == 119
+        assert "i-0" not in patch_compliance
+        assert patch_compliance["i-119"]["missing_count"] == 2
+
+
 @mock_aws
 class TestEC2Client:
     """Tests for EC2 instance client with moto mocking."""
@@ -652,8 +923,8 @@ def test_handler_error_handling(self) -> None:
         from handler import lambda_handler
 
         # Mock clients to raise errors
-        with patch("handler.EC2InstanceClient") as mock_ec2:
-            mock_ec2.return_value.get_fleet_instances.side_effect = Exception(
+        with patch("handler._EC2_CLIENT") as mock_ec2:
+            mock_ec2.get_fleet_instances.side_effect = Exception(
                 "Test error"
             )
 
@@ -671,6 +942,54 @@ def test_handler_error_handling(self) -> None:
             assert response["statusCode"] == 500
             assert "error" in response["body"]
 
+    def test_collect_skips_queries_without_running_instances(
+        self,
+        mock_ec2_instance_client: Any,
+        mock_ssm_inventory_client: Any,
+        mock_cloudwatch_metric_client: Any,
+    ) -> None:
+        """Test that an idle fleet issues no CloudWatch or SSM queries."""
+        from handler import collect_instance_metrics
+
+        stopped = [InstanceMetrics(instance_id="i-1", state="stopped")]
+        mock_ec2_instance_client.get_fleet_instances.return_value = stopped
+        mock_ec2_instance_client.summarize_instances.return_value = ({"stopped": 1}, [])
+
+        fleet_metrics = collect_instance_metrics(
+            mock_ec2_instance_client,
+            mock_ssm_inventory_client,
+            mock_cloudwatch_metric_client,
+            "test-fleet",
+        )
+
+        assert fleet_metrics.total_instances == 1
+        assert fleet_metrics.stopped_instances == 1
+        mock_cloudwatch_metric_client.query_many.assert_not_called()
+        mock_ssm_inventory_client.get_instance_compliance.assert_not_called()
+
+    def test_collect_skips_compliance_when_disabled(
+        self,
+        mock_ec2_instance_client: Any,
+        mock_ssm_inventory_client: Any,
+        mock_cloudwatch_metric_client: Any,
+    ) -> None:
+        """Test that SSM compliance is not queried when disabled."""
+        from handler import collect_instance_metrics
+
+        fleet_metrics = collect_instance_metrics(
+            mock_ec2_instance_client,
+            mock_ssm_inventory_client,
+            mock_cloudwatch_metric_client,
+            "test-fleet",
+            enable_compliance=False,
+        )
+
+        assert fleet_metrics.running_instances == 2
+        assert fleet_metrics.avg_cpu_utilization == 47.75
+        assert fleet_metrics.compliant_instances == 0
+        assert fleet_metrics.non_compliant_instances == 0
+        mock_ssm_inventory_client.get_instance_compliance.assert_not_called()
+
 
 class TestIntegration:
     """Integration tests for the full aggregation flow."""
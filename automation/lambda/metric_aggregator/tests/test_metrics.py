@@ -1042,6 +1042,26 @@ def test_empty_fleet_aggregation(self, aggregator: MetricAggregator) -> None:
         )
         assert instance_count.value == 0.0
 
+    @pytest.mark.parametrize("compliant,non_compliant", [(3, 1), (0, 0), (0, 2)])
+    def test_fused_scores_match_calculators(
+        self,
+        aggregator: MetricAggregator,
+        sample_fleet_metrics: FleetMetrics,
+        compliant: int,
+        non_compliant: int,
+    ) -> None:
+        """Test that the fused score pass agrees with each calculator."""
+        sample_fleet_metrics.compliant_instances = compliant
+        sample_fleet_metrics.non_compliant_instances = non_compliant
+
+        for fleet in (sample_fleet_metrics, FleetMetrics()):
+            assert aggregator._compute_all_scores(fleet) == (
+                aggregator.health_score_calculator.calculate(fleet),
+                aggregator.compliance_score_calculator.calculate(fleet),
+                aggregator.cost_efficiency_calculator.calculate(fleet),
+                aggregator.capacity_utilization_calculator.calculate(fleet),
+            )
+
 
 class TestMetricValidation:
     """Tests for metric value validation and edge cases."""